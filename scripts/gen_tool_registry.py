@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Generates `system/tools/_registry.py`, the static tool lookup table used by the Kernel.
+
+The Kernel mounts tools from this table instead of executing every module in
+`system/tools/` at boot. Re-run this script whenever a tool is added, renamed or
+its docstring changes:
+
+    python scripts/gen_tool_registry.py
+"""
+import ast
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+ROOT_DIR = Path(__file__).parent.parent.resolve()
+TOOLS_DIR = ROOT_DIR / "system" / "tools"
+REGISTRY_FILE = TOOLS_DIR / "_registry.py"
+
+HEADER = '''"""
+AUTO-GENERATED by scripts/gen_tool_registry.py. Do not edit by hand.
+
+Maps each public tool name to its (module, attribute) location and docstring.
+"""
+from typing import Dict, Tuple
+
+'''
+
+
+def scan_tools() -> Tuple[Dict[str, Tuple[str, str]], Dict[str, str]]:
+    """Collects public top-level functions from every tool module without importing them."""
+    tools: Dict[str, Tuple[str, str]] = {}
+    docs: Dict[str, str] = {}
+
+    for tool_file in sorted(TOOLS_DIR.glob("*.py")):
+        if tool_file.name.startswith("_"):
+            continue
+
+        module_name = f"system.tools.{tool_file.stem}"
+        tree = ast.parse(tool_file.read_text(encoding="utf-8"), filename=str(tool_file))
+
+        for node in tree.body:
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if node.name.startswith("_"):
+                continue
+            tools[node.name] = (module_name, node.name)
+            # Match the raw `__doc__` the Kernel used to render (no cleandoc)
+            docs[node.name] = ast.get_docstring(node, clean=False) or ""
+
+    return tools, docs
+
+
+def render(tools: Dict[str, Tuple[str, str]], docs: Dict[str, str]) -> str:
+    lines = [HEADER, "TOOLS: Dict[str, Tuple[str, str]] = {\n"]
+    for name in sorted(tools):
+        module_name, attr = tools[name]
+        lines.append(f"    {name!r}: ({module_name!r}, {attr!r}),\n")
+    lines.append("}\n\nTOOL_DOCS: Dict[str, str] = {\n")
+    for name in sorted(docs):
+        lines.append(f"    {name!r}: {docs[name]!r},\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main() -> None:
+    print("🧰 Generating Tool Registry")
+    tools, docs = scan_tools()
+    REGISTRY_FILE.write_text(render(tools, docs), encoding="utf-8")
+    print(f"   [✓] {len(tools)} tools -> {REGISTRY_FILE.relative_to(ROOT_DIR)}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
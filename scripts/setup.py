@@ -3,6 +3,25 @@ import os
 import sys
 from pathlib import Path
 
+def copy_file(src: Path, dst: Path) -> None:
+    """Kernel-space copy via os.sendfile where available; shutil fallback elsewhere."""
+    if hasattr(os, "sendfile"):
+        try:
+            with open(src, "rb") as s, open(dst, "wb") as d:
+                size = os.fstat(s.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            return
+        except OSError:
+            pass  # e.g. filesystems without sendfile support
+
+    import shutil
+    shutil.copyfile(src, dst)
+
 def main():
     print("🚀 Antigravity Template Setup")
     print("=============================")
@@ -24,21 +43,24 @@ def main():
     ]
     
     print("\n🛠️  Verifying Directories...")
-    for d in dirs:
-        path = root_dir / d
-        if not path.exists():
-            path.mkdir(parents=True)
+    # Parents sort before children, so a single mkdir per entry suffices
+    # (no separate exists() stat); FileExistsError doubles as the check.
+    for d in sorted(dirs):
+        try:
+            os.mkdir(root_dir / d)
             print(f"   [+] Created: {d}")
-        else:
+        except FileExistsError:
             print(f"   [✓] Exists:  {d}")
+        except FileNotFoundError:
+            (root_dir / d).mkdir(parents=True)
+            print(f"   [+] Created: {d}")
 
     # 2. Check Environment
     print("\n🌍 Environment Check...")
     if not (root_dir / ".env").exists():
         if (root_dir / ".env.example").exists():
             print("   [!] .env missing. Copying from .env.example...")
-            import shutil
-            shutil.copy(root_dir / ".env.example", root_dir / ".env")
+            copy_file(root_dir / ".env.example", root_dir / ".env")
         else:
             print("   [⚠️] .env missing and no example found.")
     else:
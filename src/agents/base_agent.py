@@ -6,9 +6,36 @@ and communication with the Gemini API.
 """
 
 import os
-from typing import Any, Dict, List, Optional
-from google import genai
-from system.config import settings
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+from system.config import get_settings
+
+if TYPE_CHECKING:
+    from google import genai
+
+
+class _MockResponse:
+    """Canned response returned by the offline client."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class _MockModels:
+    """Mirrors `genai.Client().models` for the offline client."""
+
+    def __init__(self, role: str) -> None:
+        self._response = _MockResponse(f"[{role}] Task completed")
+
+    def generate_content(self, model: str, contents: str) -> _MockResponse:
+        return self._response
+
+
+class _MockClient:
+    """Dummy client used under pytest or when the genai client cannot be built."""
+
+    def __init__(self, role: str) -> None:
+        self.models = _MockModels(role)
 
 
 class BaseAgent:
@@ -29,43 +56,25 @@ class BaseAgent:
         """
         self.role = role
         self.system_prompt = system_prompt
-        self.conversation_history: List[Dict[str, str]] = []
+        # Bounded: oldest turns fall off once MAX_HISTORY entries are held
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=get_settings().MAX_HISTORY)
         
         # Initialize Gemini client
         running_under_pytest = "PYTEST_CURRENT_TEST" in os.environ
         if running_under_pytest:
             # Dummy client for testing
-            class MockResponse:
-                text: str = f"[{role}] Task completed"
-
-            class MockModels:
-                def generate_content(self, model: str, contents: str) -> MockResponse:
-                    return MockResponse()
-
-            class MockClient:
-                def __init__(self) -> None:
-                    self.models = MockModels()
-
-            self.client: Any = MockClient()
+            self.client: Any = _MockClient(role)
         else:
             try:
-                self.client = genai.Client(api_key=settings.GOOGLE_API_KEY)
+                # Deferred import: the SDK is heavy and only needed for live calls
+                from google import genai
+
+                self.client = genai.Client(api_key=get_settings().GOOGLE_API_KEY)
             except Exception as e:
                 print(f"⚠️ {role} agent: genai client not initialized: {e}")
                 
                 # Fallback to dummy client
-                class FallbackResponse:
-                    text: str = f"[{role}] Task completed"
-
-                class FallbackModels:
-                    def generate_content(self, model: str, contents: str) -> FallbackResponse:
-                        return FallbackResponse()
-
-                class FallbackClient:
-                    def __init__(self) -> None:
-                        self.models = FallbackModels()
-
-                self.client = FallbackClient()
+                self.client = _MockClient(role)
     
     def execute(self, task: str, context: Optional[List[Dict[str, str]]] = None) -> str:
         """
@@ -93,7 +102,7 @@ class BaseAgent:
         # Call Gemini API
         try:
             response = self.client.models.generate_content(
-                model=settings.GEMINI_MODEL_NAME,
+                model=get_settings().GEMINI_MODEL_NAME,
                 contents=full_prompt
             )
             result = str(getattr(response, "text", str(response))).strip()
@@ -114,4 +123,4 @@ class BaseAgent:
     
     def reset_history(self) -> None:
         """Clear the conversation history."""
-        self.conversation_history = []
+        self.conversation_history.clear()
@@ -36,8 +36,9 @@ When analyzing a task, respond with a delegation plan in this format:
 DELEGATION:
 - agent: <agent_name>
 - task: <specific task for that agent>
+- depends_on: <optional comma-separated numbers of earlier steps this one needs>
 
-You may delegate to multiple agents in sequence or parallel."""
+Steps without depends_on run in parallel; repeated steps for one agent run in order."""
         
         super().__init__(role="router", system_prompt=system_prompt)
     
@@ -49,7 +50,8 @@ You may delegate to multiple agents in sequence or parallel."""
             user_task: The task provided by the user.
             
         Returns:
-            List of delegation instructions, each containing 'agent' and 'task'.
+            List of delegation instructions, each containing 'agent' and 'task'
+            and optionally 'depends_on' (1-based step numbers).
         """
         analysis = self.execute(user_task)
         
@@ -66,6 +68,8 @@ You may delegate to multiple agents in sequence or parallel."""
                 current_delegation = {'agent': line.split(':', 1)[1].strip()}
             elif line.startswith('- task:') and current_delegation:
                 current_delegation['task'] = line.split(':', 1)[1].strip()
+            elif line.startswith('- depends_on:') and current_delegation:
+                current_delegation['depends_on'] = line.split(':', 1)[1].strip()
         
         if current_delegation and 'task' in current_delegation:
             delegations.append(current_delegation)
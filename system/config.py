@@ -9,11 +9,13 @@ Capabilities:
 - Default path resolution for 'Hyperscale' directory topology.
 """
 
+import functools
 import os
 from pathlib import Path
-from typing import List, Optional, Dict
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import TYPE_CHECKING, Any, List, Optional, Dict, Tuple, Type
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
 # Define Root Paths
 # Assumes this file is in system/config.py -> parent is system/ -> parent is root
@@ -21,8 +23,38 @@ ROOT_DIR = Path(__file__).parent.parent
 ARTIFACTS_DIR = ROOT_DIR / "artifacts"
 SYSTEM_DIR = ROOT_DIR / "system"
 
-class MCPServerConfig(BaseSettings):
-    """Configuration schema for a single MCP node."""
+# Set ANTIGRAVITY_SKIP_DOTENV=1 (e.g. in tests/CI) to never touch .env on disk
+ENV_FILE: Optional[str] = None if os.getenv("ANTIGRAVITY_SKIP_DOTENV") == "1" else str(ROOT_DIR / ".env")
+
+@functools.lru_cache(maxsize=8)
+def _read_dotenv(path: str, encoding: str = "utf-8") -> Dict[str, Optional[str]]:
+    """Parses a .env file once per process; repeated Settings() reuse the result."""
+    if not os.path.isfile(path):
+        return {}
+    from dotenv import dotenv_values
+    return dict(dotenv_values(path, encoding=encoding))
+
+class _CachedDotEnvSource(PydanticBaseSettingsSource):
+    """Drop-in for the stock dotenv source, backed by `_read_dotenv`."""
+
+    def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
+        return None, field_name, False
+
+    def __call__(self) -> Dict[str, Any]:
+        env_file = self.config.get("env_file")
+        if not env_file:
+            return {}
+        values = _read_dotenv(str(env_file), self.config.get("env_file_encoding") or "utf-8")
+        # Case-insensitive key match, as with the stock source
+        fields = {name.upper(): name for name in self.settings_cls.model_fields}
+        return {
+            fields[key.upper()]: value
+            for key, value in values.items()
+            if value is not None and key.upper() in fields
+        }
+
+class MCPServerConfig(BaseModel):
+    """Configuration schema for a single MCP node (parsed from the JSON manifest, not env)."""
     name: str = Field(..., description="Unique identifier for the server node.")
     transport: str = Field("stdio", pattern="^(stdio|http|sse)$")
     command: Optional[str] = None
@@ -31,7 +63,10 @@ class MCPServerConfig(BaseSettings):
     env: Dict[str, str] = Field(default_factory=dict)
     enabled: bool = True
     
-    model_config = SettingsConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+# Compiled once: validates a whole manifest `servers` list in a single pass
+MCPServerListAdapter: TypeAdapter[List[MCPServerConfig]] = TypeAdapter(List[MCPServerConfig])
 
 class Settings(BaseSettings):
     """
@@ -46,10 +81,12 @@ class Settings(BaseSettings):
     # --- Agent Identity ---
     AGENT_NAME: str = "Antigravity Recursive Core"
     DEBUG_MODE: bool = False
+    MAX_HISTORY: int = Field(default=50, description="Max conversation entries retained per swarm agent.")
 
     # --- Cognitive Substrate (Memory) ---
     # Path relative to root, or absolute path
     MEMORY_FILE: str = str(ARTIFACTS_DIR / "memory" / "agent_memory.json")
+    MEMORY_SNAPSHOT_INTERVAL: int = Field(default=20, description="Journaled entries between full memory snapshots.")
 
     # --- MCP (Model Context Protocol) ---
     MCP_ENABLED: bool = Field(default=False, description="Master switch for external tool connectivity.")
@@ -61,21 +98,55 @@ class Settings(BaseSettings):
     OPENAI_BASE_URL: str = ""
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4o-mini"
+    OPENAI_CACHE_FILE: str = Field(default="", description="SQLite file persisting cached LLM replies (empty = memory only).")
 
     model_config = SettingsConfigDict(
-        env_file=str(ROOT_DIR / ".env"), 
+        env_file=ENV_FILE, 
         env_file_encoding="utf-8", 
         extra="ignore"
     )
 
-# Singleton Instantiation
-settings = Settings()
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        # Same precedence as the default; only the .env reader is swapped for the cached one
+        return init_settings, env_settings, _CachedDotEnvSource(settings_cls), file_secret_settings
+
+# Leaf directories only: ARTIFACTS_DIR itself is created implicitly as their parent
+_REQUIRED_DIRS = (
+    ARTIFACTS_DIR / "memory",
+    ARTIFACTS_DIR / "logs",
+    ARTIFACTS_DIR / "plans",
+)
 
 # Validation hook to ensure critical directories exist
 def ensure_directories() -> None:
-    ARTIFACTS_DIR.mkdir(exist_ok=True)
-    (ARTIFACTS_DIR / "memory").mkdir(exist_ok=True)
-    (ARTIFACTS_DIR / "logs").mkdir(exist_ok=True)
-    (ARTIFACTS_DIR / "plans").mkdir(exist_ok=True)
+    for path in _REQUIRED_DIRS:
+        # Tries mkdir directly; parents are only walked when one is missing
+        path.mkdir(parents=True, exist_ok=True)
+
+# Singleton Instantiation (Lazy)
+# Built on first access of `settings` so importing this module stays cheap.
+_settings: Optional[Settings] = None
+
+if TYPE_CHECKING:
+    settings: Settings
+
+def get_settings() -> Settings:
+    """Returns the process-wide Settings singleton, constructing it on first use."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+        ensure_directories()
+    return _settings
 
-ensure_directories()
+def __getattr__(name: str) -> Any:
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,30 +1,80 @@
 # Kernel Alpha: State Machine Edition
-import json
+import re
 import time
 import os
 import sys
 import asyncio
-import inspect
-import importlib.util
+import importlib
+import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, Literal
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TextIO, Tuple, Union, Literal
 from datetime import datetime
 
 # External dependencies
-from google import genai
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from google import genai
+
+try:
+    import orjson
+    _json_loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 
 # Internal dependencies
 try:
-    from system.config import settings
+    from system.config import get_settings
     from system.kernel.memory import MemoryManager, MemoryEntry
+    from system.kernel.tool_queue import ToolQueue
 except ImportError:
     # Fallback for when running directly or in different path structure
     root = Path(__file__).parent.parent.parent
     if str(root) not in sys.path:
         sys.path.append(str(root))
-    from system.config import settings
+    from system.config import get_settings
     from system.kernel.memory import MemoryManager, MemoryEntry
+    from system.kernel.tool_queue import ToolQueue
+
+# Kernel tracing. Silent unless the host configures logging (cli_main does).
+log = logging.getLogger("arc")
+log.addHandler(logging.NullHandler())
+
+# Outermost {...} span of a DECIDE response (greedy, spans newlines)
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+# Remainder of the first "Current Objective:" line in mission.md
+_OBJECTIVE_RE = re.compile(r"Current Objective:(.*)")
+
+class LazyTool:
+    """Deferred tool handle: imports the backing module on first invocation."""
+
+    def __init__(self, name: str, module: str, attr: str, doc: Optional[str] = None) -> None:
+        self.__name__ = name
+        self.__doc__ = doc
+        self._module = module
+        self._attr = attr
+        self._fn: Optional[Callable[..., Any]] = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self._fn is None:
+            self._fn = getattr(importlib.import_module(self._module), self._attr)
+        return self._fn(*args, **kwargs)
+
+class _MockResponse:
+    text: str = "I have executed the requested operation based on internal simulation."
+
+class _MockModels:
+    _response = _MockResponse()
+
+    def generate_content(self, model: str, contents: str) -> _MockResponse:
+        return self._response
+
+class _MockClient:
+    """Stateless stand-in for genai.Client used in testing/offline mode."""
+    models = _MockModels()
+
+_MOCK_CLIENT = _MockClient()
 
 class AgentState(BaseModel):
     """Represents the current cognitive state of the Agent."""
@@ -45,51 +95,69 @@ class GeminiAgent:
 
     def __init__(self) -> None:
         self.state = AgentState()
-        self.settings = settings
-        self.memory = MemoryManager()
+        self.settings = get_settings()
+        self._memory: Optional[MemoryManager] = None
+        self._available_tools: Optional[Dict[str, Callable[..., Any]]] = None
+        self._tool_list_str: Optional[str] = None
+        self._system_prompt_template: Optional[str] = None
         self.mcp_manager: Optional[Any] = None
+        # Async tool dispatch (arun); batches concurrent callers and isolates the sandbox
+        self.tool_queue = ToolQueue()
         
         # Paths
         self.root_dir = Path(__file__).parent.parent.parent
         self.artifacts_dir = self.root_dir / "artifacts"
         self.logs_dir = self.artifacts_dir / "logs"
         self.logs_dir.mkdir(parents=True, exist_ok=True)
+        # One thought stream per agent lifetime; opened on first write
+        self._boot_stamp = time.strftime("%Y%m%d_%H%M%S")
+        self.thought_log_path = self.logs_dir / f"thought_stream_{self._boot_stamp}.md"
+        self._log_fh: Optional[TextIO] = None
 
         # 1. Boot Sequence
         self.transition("BOOT")
         self._boot_sequence()
 
-        # 2. Tool Loading
-        self.available_tools: Dict[str, Callable[..., Any]] = self._load_tools()
-        self.state.tools_loaded = len(self.available_tools)
-
-        # 3. MCP Initialization
-        if self.settings.MCP_ENABLED:
-            self._initialize_mcp()
-
-        # 4. Neural Link (Client) Initialization
+        # 2. Neural Link (Client) Initialization
+        # Memory, tools and MCP are mounted lazily on first use (see properties below).
         self.client = self._initialize_client()
         self.transition("IDLE")
 
+    @property
+    def memory(self) -> MemoryManager:
+        """Cognitive substrate, loaded from disk on first access."""
+        if self._memory is None:
+            self._memory = MemoryManager()
+        return self._memory
+
+    @property
+    def available_tools(self) -> Dict[str, Callable[..., Any]]:
+        """Tool registry (local + MCP), mounted on first access."""
+        if self._available_tools is None:
+            self._available_tools = self._load_tools()
+            if self.settings.MCP_ENABLED:
+                self._initialize_mcp()
+            self.state.tools_loaded = len(self._available_tools)
+        return self._available_tools
+
     def transition(self, next_phase: Literal["BOOT", "OBSERVE", "ORIENT", "DECIDE", "ACT", "REFLECT", "IDLE"]) -> None:
         """Governs state transitions."""
-        print(f"🔄 [STATE] Transitioning: {self.state.phase} -> {next_phase}")
+        log.info("🔄 [STATE] Transitioning: %s -> %s", self.state.phase, next_phase)
         self.state.phase = next_phase
 
     def _boot_sequence(self) -> None:
         """Initializes the Agent's identity and governs alignment."""
-        print("\n🚀 SYSTEM BOOT: Antigravity Recursive Core")
+        log.info("\n🚀 SYSTEM BOOT: Antigravity Recursive Core")
         
         # Load Mission
         mission_path = self.root_dir / "mission.md"
         if mission_path.exists():
             content = mission_path.read_text(encoding="utf-8")
-            for line in content.splitlines():
-                if "Current Objective:" in line:
-                    self.state.mission_objective = line.split("Current Objective:")[1].strip()
-                    break
+            match = _OBJECTIVE_RE.search(content)
+            if match:
+                self.state.mission_objective = match.group(1).strip()
         
-        print(f"   🎯 Current Objective: {self.state.mission_objective}")
+        log.info("   🎯 Current Objective: %s", self.state.mission_objective)
 
     def _initialize_client(self) -> Any:
         """Initializes the Gemini Client with fallback for CI/CD environments."""
@@ -99,24 +167,17 @@ class GeminiAgent:
             return self._create_mock_client()
         
         try:
+            # Deferred import: keeps the Google SDK off the mock/offline path
+            from google import genai
+
             return genai.Client(api_key=self.settings.GOOGLE_API_KEY)
         except Exception as e:
-            print(f"   ⚠️ Connection Failure: {e}")
+            log.warning("   ⚠️ Connection Failure: %s", e)
             return self._create_mock_client()
 
     def _create_mock_client(self) -> Any:
-        """Creates a dummy client for testing/offline mode."""
-        class MockResponse:
-            text: str = "I have executed the requested operation based on internal simulation."
-        
-        class MockModels:
-            def generate_content(self, model: str, contents: str) -> MockResponse:
-                return MockResponse()
-        
-        class MockClient:
-            models = MockModels()
-            
-        return MockClient()
+        """Returns the shared dummy client for testing/offline mode."""
+        return _MOCK_CLIENT
 
     def _initialize_mcp(self) -> None:
         """Initialize MCP (Model Context Protocol) integration."""
@@ -133,13 +194,29 @@ class GeminiAgent:
                 if mcp_tools:
                     self.available_tools.update(mcp_tools)
                     self.state.mcp_active = True
-                    print(f"   🔧 MCP Active: {len(mcp_tools)} remote tools linked.")
+                    log.info("   🔧 MCP Active: %d remote tools linked.", len(mcp_tools))
 
         except Exception as e:
-            print(f"   ⚠️ MCP Init Error: {e}")
+            log.warning("   ⚠️ MCP Init Error: %s", e)
 
     def _load_tools(self) -> Dict[str, Callable[..., Any]]:
-        """Dynamically mounts tools from system/tools/."""
+        """Mounts tools from the pre-generated registry (scripts/gen_tool_registry.py)."""
+        try:
+            from system.tools._registry import TOOLS, TOOL_DOCS
+        except ImportError:
+            log.warning("   ⚠️ Tool registry missing; scanning system/tools/ instead.")
+            return self._scan_tools()
+
+        return {
+            name: LazyTool(name, module, attr, TOOL_DOCS.get(name))
+            for name, (module, attr) in TOOLS.items()
+        }
+
+    def _scan_tools(self) -> Dict[str, Callable[..., Any]]:
+        """Dynamically mounts tools from system/tools/ (registry fallback)."""
+        import inspect
+        import importlib.util
+
         tools: Dict[str, Callable[..., Any]] = {}
         tools_dir = self.root_dir / "system" / "tools"
         
@@ -160,18 +237,15 @@ class GeminiAgent:
                         if not name.startswith("_") and obj.__module__ == module.__name__:
                             tools[name] = obj
             except Exception as e:
-                print(f"   ⚠️ Failed to mount tool {tool_file.name}: {e}")
+                log.warning("   ⚠️ Failed to mount tool %s: %s", tool_file.name, e)
         
         return tools
 
     def _log_thought(self, stage: str, content: str) -> None:
         """Persists internal monologue to artifacts."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = self.logs_dir / f"thought_stream_{timestamp}.md"
-        
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(f"## [{stage}] {datetime.now().isoformat()}\n")
-            f.write(f"{content}\n\n")
+        if self._log_fh is None:
+            self._log_fh = open(self.thought_log_path, "a", encoding="utf-8", buffering=8192)
+        self._log_fh.write(f"## [{stage}] {datetime.now().isoformat(timespec='seconds')}\n{content}\n\n")
 
     def _call_gemini(self, prompt: str) -> str:
         """Executes a neural query against the Gemini Substrate."""
@@ -181,24 +255,85 @@ class GeminiAgent:
                 contents=prompt,
             )
             text = getattr(response, "text", None) or getattr(response, "content", "")
-            return str(text).strip()
+            return text.strip() if isinstance(text, str) else str(text).strip()
+        except Exception as e:
+            return f"Error: Neural Link Unstable ({e})."
+
+    async def _acall_gemini(self, prompt: str) -> str:
+        """Async neural query; uses the SDK's aio surface, else offloads the sync call."""
+        aio = getattr(self.client, "aio", None)
+        if aio is None:
+            return await asyncio.to_thread(self._call_gemini, prompt)
+        try:
+            response = await aio.models.generate_content(
+                model=self.settings.GEMINI_MODEL_NAME,
+                contents=prompt,
+            )
+            text = getattr(response, "text", None) or getattr(response, "content", "")
+            return text.strip() if isinstance(text, str) else str(text).strip()
+        except Exception as e:
+            return f"Error: Neural Link Unstable ({e})."
+
+    def _consume_chunk(self, parts: List[str], chunk: Any) -> bool:
+        """Buffers a streamed chunk. Returns True once a complete tool call is buffered."""
+        text = getattr(chunk, "text", None) or ""
+        parts.append(text)
+        return "}" in text and self._extract_tool_call("".join(parts))[0] is not None
+
+    def _call_gemini_stream(self, prompt: str) -> str:
+        """Streams a neural query, hanging up as soon as a tool call has been emitted."""
+        stream_fn = getattr(self.client.models, "generate_content_stream", None)
+        if stream_fn is None:
+            return self._call_gemini(prompt)
+
+        parts: List[str] = []
+        try:
+            stream = stream_fn(model=self.settings.GEMINI_MODEL_NAME, contents=prompt)
+            try:
+                for chunk in stream:
+                    if self._consume_chunk(parts, chunk): break
+            finally:
+                close = getattr(stream, "close", None)
+                if close: close()
+            return "".join(parts).strip()
+        except Exception as e:
+            return f"Error: Neural Link Unstable ({e})."
+
+    async def _acall_gemini_stream(self, prompt: str) -> str:
+        """Async variant of `_call_gemini_stream`."""
+        aio = getattr(self.client, "aio", None)
+        if aio is None:
+            return await asyncio.to_thread(self._call_gemini_stream, prompt)
+
+        parts: List[str] = []
+        try:
+            stream = await aio.models.generate_content_stream(
+                model=self.settings.GEMINI_MODEL_NAME,
+                contents=prompt,
+            )
+            try:
+                async for chunk in stream:
+                    if self._consume_chunk(parts, chunk): break
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose: await aclose()
+            return "".join(parts).strip()
         except Exception as e:
             return f"Error: Neural Link Unstable ({e})."
 
     def _extract_tool_call(self, response_text: str) -> Tuple[Optional[str], Dict[str, Any]]:
         """Parses the 'Decision' phase for actionable tool calls."""
-        cleaned = response_text.strip()
+        match = _JSON_RE.search(response_text)
+        if not match:
+            return None, {}
         try:
-            if "{" in cleaned and "}" in cleaned:
-                start = cleaned.find("{")
-                end = cleaned.rfind("}") + 1
-                json_str = cleaned[start:end]
-                payload = json.loads(json_str)
-                if isinstance(payload, dict):
-                    action = payload.get("action") or payload.get("tool")
-                    args = payload.get("args") or payload.get("input") or {}
-                    if action: return str(action), args
-        except: pass
+            payload = _json_loads(match.group(0))
+        except ValueError:  # json / orjson JSONDecodeError
+            return None, {}
+        if isinstance(payload, dict):
+            action = payload.get("action") or payload.get("tool")
+            args = payload.get("args") or payload.get("input") or {}
+            if action: return str(action), args
         return None, {}
 
     def observe(self, task: str) -> None:
@@ -206,84 +341,127 @@ class GeminiAgent:
         self.transition("OBSERVE")
         self.state.current_task = task
         self.memory.add_entry("user", task)
-        print(f"👀 [OBSERVE] Task Ingested: {task}")
+        log.info("👀 [OBSERVE] Task Ingested: %s", task)
+
+    def _get_system_prompt(self) -> str:
+        """Renders the static system prompt once; it only depends on the tool registry."""
+        if self._system_prompt_template is None:
+            self._tool_list_str = "\n".join([f"- {n}: {f.__doc__}" for n, f in self.available_tools.items()])
+            self._system_prompt_template = (
+                "IDENTITY: Hyperscale Engineering Agent (ARC).\n"
+                "PROTOCOL: recursive_self_improvement_v1.\n"
+                f"AVAILABLE TOOLS:\n{self._tool_list_str}\n\n"
+                "INSTRUCTION: To use a tool, output JSON: {\"action\": \"tool_name\", \"args\": {...}}.\n"
+                "Otherwise, provide the final answer."
+            )
+        return self._system_prompt_template
 
     def orient(self) -> None:
         """Phase 2: Load memory and tool schemas."""
         self.transition("ORIENT")
-        tool_list = "\n".join([f"- {n}: {f.__doc__}" for n, f in self.available_tools.items()])
+        system_prompt = self._get_system_prompt()
         self.state.last_thought = f"Loaded {self.state.tools_loaded} tools. Constructing context..."
         
-        system_prompt = (
-            "IDENTITY: Hyperscale Engineering Agent (ARC).\n"
-            "PROTOCOL: recursive_self_improvement_v1.\n"
-            f"AVAILABLE TOOLS:\n{tool_list}\n\n"
-            "INSTRUCTION: To use a tool, output JSON: {\"action\": \"tool_name\", \"args\": {...}}.\n"
-            "Otherwise, provide the final answer."
-        )
-        
         self.current_context: List[Dict[str, str]] = self.memory.get_context_window(
             system_prompt=system_prompt,
             max_messages=10,
             summarizer=lambda x, y: self._call_gemini(f"Summarize these memory entries: {x}")
         )
 
-    def decide(self) -> Tuple[Optional[str], Dict[str, Any]]:
-        """Phase 3: Query neural core for next action."""
-        self.transition("DECIDE")
+    def _decision_prompt(self) -> str:
         formatted_context = "\n".join([f"{m['role'].upper()}: {m['content']}" for m in self.current_context])
-        final_prompt = f"{formatted_context}\n\nUSER TASK: {self.state.current_task}"
-        
-        print("⚡ [DECIDE] Querying Neural Core...")
-        decision = self._call_gemini(final_prompt)
+        return f"{formatted_context}\n\nUSER TASK: {self.state.current_task}"
+
+    def _record_decision(self, decision: str) -> Tuple[Optional[str], Dict[str, Any]]:
         self.state.decision = decision
         self._log_thought("DECISION", decision)
-        
         return self._extract_tool_call(decision)
 
-    def act(self, tool_name: Optional[str], tool_args: Dict[str, Any]) -> None:
-        """Phase 4: Execute tool or return final response."""
-        self.transition("ACT")
+    def decide(self) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Phase 3: Query neural core for next action."""
+        self.transition("DECIDE")
+        final_prompt = self._decision_prompt()
         
-        if not tool_name:
-            print("🏁 [ACT] No tool call detected. Finalizing response.")
-            self.state.observation = self.state.decision
-            return
+        log.info("⚡ [DECIDE] Querying Neural Core...")
+        return self._record_decision(self._call_gemini_stream(final_prompt))
+
+    async def adecide(self) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Phase 3 (async): Query neural core for next action."""
+        self.transition("DECIDE")
+        final_prompt = self._decision_prompt()
         
-        observation: str = ""
-        print(f"🛠️ [ACT] Invoking: {tool_name}")
+        log.info("⚡ [DECIDE] Querying Neural Core...")
+        return self._record_decision(await self._acall_gemini_stream(final_prompt))
+
+    def _invoke_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> str:
+        """Phase 4a: Executes the selected tool and records the observation."""
+        log.info("🛠️ [ACT] Invoking: %s", tool_name)
         tool_fn = self.available_tools.get(tool_name)
         
         if tool_fn:
             try:
                 result = tool_fn(**tool_args)
-                observation = str(result)
+                observation = result if isinstance(result, str) else str(result)
+            except Exception as e:
+                observation = f"Tool Failure: {e}"
+        else:
+            observation = "Error: Tool not found."
+        return self._record_observation(tool_name, observation)
+
+    async def _ainvoke_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> str:
+        """Phase 4a (async): Dispatches the selected tool through the ToolQueue."""
+        log.info("🛠️ [ACT] Invoking: %s", tool_name)
+        tool_fn = self.available_tools.get(tool_name)  # Mounted during ORIENT
+
+        if tool_fn:
+            try:
+                result = await self.tool_queue.put(tool_fn, **tool_args)
+                observation = result if isinstance(result, str) else str(result)
             except Exception as e:
                 observation = f"Tool Failure: {e}"
         else:
             observation = "Error: Tool not found."
+        return self._record_observation(tool_name, observation)
 
+    def _record_observation(self, tool_name: str, observation: str) -> str:
         self.state.observation = observation
-        self.memory.add_entry("assistant", str(self.state.decision))
+        self.memory.add_entry("assistant", self.state.decision or "")
         self.memory.add_entry("tool", f"Observation from {tool_name}: {observation}", metadata={"tool": tool_name})
-        
-        # Second act: Synthesis
-        print("🧪 [ACT] Synthesizing tool output...")
-        synthesis_prompt = (
+        return observation
+
+    def _synthesis_prompt(self, observation: str) -> str:
+        return (
             f"TASK: {self.state.current_task}\n"
             f"DECISION: {self.state.decision}\n"
             f"TOOL_OUTPUT: {observation}\n"
             "INSTRUCTION: Provide the final answer based on the tool output."
         )
-        final_answer = self._call_gemini(synthesis_prompt)
+
+    def _record_answer(self, final_answer: str) -> None:
         self.state.observation = final_answer
         self.memory.add_entry("assistant", final_answer)
 
-    def reflect(self) -> None:
-        """Phase 5: Post-action audit and self-learning."""
-        self.transition("REFLECT")
+    def _finalize_without_tool(self) -> None:
+        log.info("🏁 [ACT] No tool call detected. Finalizing response.")
+        self.state.observation = self.state.decision
+
+    def act(self, tool_name: Optional[str], tool_args: Dict[str, Any]) -> None:
+        """Phase 4: Execute tool or return final response."""
+        self.transition("ACT")
+        
+        if not tool_name:
+            self._finalize_without_tool()
+            return
+        
+        observation = self._invoke_tool(tool_name, tool_args)
         
-        observation_text = str(self.state.observation).lower() if self.state.observation else ""
+        # Second act: Synthesis
+        log.info("🧪 [ACT] Synthesizing tool output...")
+        self._record_answer(self._call_gemini(self._synthesis_prompt(observation)))
+
+    def _reflection_prompt(self) -> Tuple[str, str]:
+        """Builds the audit prompt for the current outcome. Returns (prompt, reflection_type)."""
+        observation_text = self.state.observation.lower() if self.state.observation else ""
         is_failure = "error" in observation_text or "failed" in observation_text or "failure" in observation_text
         
         reflection_type = "CRITICAL ANALYSIS" if is_failure else "REINFORCEMENT"
@@ -296,27 +474,88 @@ class GeminiAgent:
             f"INSTRUCTION: Perform a {reflection_type}. "
             f"{'Analyze why it failed and propose a fix.' if is_failure else 'Analyze why it succeeded and consolidate the strategy.'}"
         )
-        
-        print(f"🪞 [REFLECT] Generating {reflection_type}...")
-        insight = self._call_gemini(prompt)
-        
+        return prompt, reflection_type
+
+    def _begin_reflection(self) -> Tuple[str, str]:
+        """Enters REFLECT and returns (prompt, reflection_type) for the audit query."""
+        self.transition("REFLECT")
+        prompt, reflection_type = self._reflection_prompt()
+        log.info("🪞 [REFLECT] Generating %s...", reflection_type)
+        return prompt, reflection_type
+
+    def _record_reflection(self, reflection_type: str, insight: str) -> None:
         self._log_thought("REFLECTION", insight)
         self.memory.add_entry("system", f"REFLECTION ({reflection_type}): {insight}")
-        
         self.transition("IDLE")
 
-    def run(self, task: str) -> None:
-        """Orchestrates the OODA loop."""
-        print(f"\n▶️ EXECUTION START: {task}")
+    def reflect(self) -> None:
+        """Phase 5: Post-action audit and self-learning."""
+        prompt, reflection_type = self._begin_reflection()
+        self._record_reflection(reflection_type, self._call_gemini(prompt))
+
+    async def arun(self, task: str) -> None:
+        """
+        Orchestrates the OODA loop with overlapped neural round-trips.
+
+        When a tool is used, REFLECT audits the raw tool outcome concurrently with
+        the ACT synthesis call instead of waiting for it. Callers own shutdown().
+        """
+        log.info("\n▶️ EXECUTION START: %s", task)
+        try:
+            self.observe(task)
+            # ORIENT may mount tools/MCP and summarize memory (blocking); keep it off the loop
+            await asyncio.to_thread(self.orient)
+            tool_name, tool_args = await self.adecide()
+
+            self.transition("ACT")
+            if not tool_name:
+                self._finalize_without_tool()
+                prompt, reflection_type = self._begin_reflection()
+                insight = await self._acall_gemini(prompt)
+            else:
+                observation = await self._ainvoke_tool(tool_name, tool_args)
+                prompt, reflection_type = self._begin_reflection()
+                log.info("🧪 [ACT] Synthesizing tool output...")
+                final_answer, insight = await asyncio.gather(
+                    self._acall_gemini(self._synthesis_prompt(observation)),
+                    self._acall_gemini(prompt),
+                )
+                self._record_answer(final_answer)
+
+            self._record_reflection(reflection_type, insight)
+            log.info("\n🏁 EXECUTION FINISH. Result:\n%s", self.state.observation)
+        except Exception as e:
+            log.error("❌ EXECUTION FAILED: %s", e)
+        finally:
+            await self.tool_queue.close()
+
+    def _run_sync(self, task: str) -> None:
+        """The OODA loop one phase at a time, without an event loop."""
+        log.info("\n▶️ EXECUTION START: %s", task)
         try:
             self.observe(task)
             self.orient()
             tool_name, tool_args = self.decide()
             self.act(tool_name, tool_args)
             self.reflect()
-            print(f"\n🏁 EXECUTION FINISH. Result:\n{self.state.observation}")
+            log.info("\n🏁 EXECUTION FINISH. Result:\n%s", self.state.observation)
         except Exception as e:
-            print(f"❌ EXECUTION FAILED: {e}")
+            log.error("❌ EXECUTION FAILED: %s", e)
+
+    def run(self, task: str) -> None:
+        """
+        Orchestrates the OODA loop (blocking entrypoint).
+
+        Uses the overlapped `arun` when no event loop is running. Inside a host's loop
+        (Jupyter, an async MCP host) `asyncio.run` cannot nest, so the phases run serially.
+        """
+        try:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self.arun(task))
+            else:
+                self._run_sync(task)
         finally:
             self.shutdown()
 
@@ -324,9 +563,30 @@ class GeminiAgent:
         """Cleanup Protocol."""
         if self.mcp_manager:
             self.mcp_manager.shutdown()
-        print("💤 System Offline.")
+        if self._memory is not None:
+            self._memory.save_memory()  # Fold the journal into the snapshot
+        if self._log_fh:
+            self._log_fh.close()
+            self._log_fh = None
+        log.info("💤 System Offline.")
+
+def cli_main(argv: Optional[List[str]] = None) -> None:
+    """
+    Standard Entrypoint for the Antigravity Agent (`antigravity` console script).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="antigravity", description="Run one OODA cycle of the Antigravity Agent.")
+    parser.add_argument("task", nargs="?", default="Assess internal system health.", help="Task for the agent.")
+    args = parser.parse_args(argv)
+
+    # The CLI is the one place that opts in to rendering kernel traces
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log.info("🤖 Antigravity Agent Kernel Initializing...")
+    log.info("📋 Task: %s", args.task)
 
-if __name__ == "__main__":
     agent = GeminiAgent()
-    task = sys.argv[1] if len(sys.argv) > 1 else "Perform system diagnostic."
-    agent.run(task)
+    agent.run(args.task)
+
+if __name__ == "__main__":
+    cli_main()
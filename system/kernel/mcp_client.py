@@ -13,19 +13,32 @@ import asyncio
 import json
 import os
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Third-party imports
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
+
+try:
+    import ijson  # Optional: streams the manifest one server entry at a time
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _json_loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Internal System Imports
 try:
-    from system.config import settings, MCPServerConfig
+    from system.config import get_settings, MCPServerConfig, MCPServerListAdapter
 except ImportError:
     # Fallback for legacy structure or direct execution
     sys.path.append(str(Path(__file__).parent.parent.parent))
-    from system.config import settings, MCPServerConfig
+    from system.config import get_settings, MCPServerConfig, MCPServerListAdapter
 
 # ------------------------------------------------------------------------------
 # Data Models (Schema First)
@@ -40,6 +53,15 @@ class MCPTool(BaseModel):
     server_name: str
     input_schema: Dict[str, Any] = Field(default_factory=dict)
     original_name: str
+    prefixed_name: str = ""  # Resolved once at discovery via get_prefixed_name()
+    _schema_json: str = PrivateAttr(default="")  # Compact input_schema dump, rendered once
+
+    @property
+    def schema_json(self) -> str:
+        """Compact JSON of `input_schema`, serialized on first access and then reused."""
+        if not self._schema_json:
+            self._schema_json = json.dumps(self.input_schema, separators=(',', ':'))
+        return self._schema_json
 
     def get_prefixed_name(self, prefix: str = "") -> str:
         """Generates the namespaced identifier for the Agent's tool registry."""
@@ -60,6 +82,49 @@ class MCPServerConnection(BaseModel):
     error: Optional[str] = None
     _client_cm: Any = None  # Internal Context Manager
 
+class MCPToolProxy:
+    # Awaitable local stand-in for one remote tool; call with the tool's keyword arguments.
+    # (A comment, not a docstring: a class docstring would clash with the `__doc__` slot,
+    # which holds each proxy's prompt description.)
+    __slots__ = ("__name__", "__doc__", "_connection", "_original_name")
+
+    def __init__(self, connection: MCPServerConnection, tool: MCPTool, name: str, doc: str) -> None:
+        self.__name__ = name
+        self.__doc__ = doc
+        self._connection = connection
+        self._original_name = tool.original_name
+
+    async def __call__(self, **kwargs: Any) -> Any:
+        connection = self._connection
+        if not connection.connected or not connection.session:
+            return "Error: Connection lost."
+        
+        try:
+            result = await connection.session.call_tool(self._original_name, arguments=kwargs)
+            
+            # Unpack standard MCP content types
+            if hasattr(result, "content") and result.content:
+                contents = []
+                for content in result.content:
+                    if hasattr(content, "text"): contents.append(content.text)
+                    elif hasattr(content, "data"): contents.append(f"<Binary Data: {len(content.data)} bytes>")
+                return "\n".join(contents) if contents else str(result)
+            
+            return str(result)
+        except Exception as e:
+            return f"MCP Execution Error: {e}"
+
+
+# ------------------------------------------------------------------------------
+# Discovery Caches (process-wide, shared by every manager instance)
+# ------------------------------------------------------------------------------
+
+# Manifest path -> (st_mtime_ns, parsed enabled configs)
+_MANIFEST_CACHE: Dict[str, Tuple[int, List[MCPServerConfig]]] = {}
+# (tool prefix, server config JSON) -> (monotonic stamp, discovered tools)
+_TOOLS_CACHE: Dict[Tuple[str, str], Tuple[float, List[MCPTool]]] = {}
+_TOOLS_TTL = 300.0  # seconds
+
 # ------------------------------------------------------------------------------
 # Async Manager
 # ------------------------------------------------------------------------------
@@ -73,11 +138,17 @@ class MCPClientManager:
     """
 
     def __init__(self, config_path: Optional[str] = None):
+        settings = get_settings()
         self.config_path = config_path or settings.MCP_SERVERS_CONFIG
         self.servers: Dict[str, MCPServerConnection] = {}
         self.tool_prefix = settings.MCP_TOOL_PREFIX
         self._initialized = False
         self._lock = asyncio.Lock()
+        # Layer-4 caches: rendered tool docstrings and the synthesized callable map
+        self.server_descriptions: Dict[str, str] = {}
+        self._callables_cache: Optional[Dict[str, Callable[..., Any]]] = None
+        # One pooled HTTP client shared by every streamable-HTTP node (keep-alive + TLS reuse)
+        self._http_client: Any = None
 
     def _load_server_configs(self) -> List[MCPServerConfig]:
         """Parses the MCP configuration manifest."""
@@ -88,14 +159,22 @@ class MCPClientManager:
             return []
 
         try:
-            content = config_file.read_text(encoding="utf-8")
-            data = json.loads(content)
-            
-            configs = []
-            for server_data in data.get("servers", []):
-                if server_data.get("enabled", True):
-                    configs.append(MCPServerConfig(**server_data))
-            return configs
+            cache_key = str(config_file.resolve())
+            mtime = config_file.stat().st_mtime_ns
+            cached = _MANIFEST_CACHE.get(cache_key)
+            if cached is not None and cached[0] == mtime:
+                return list(cached[1])
+
+            with config_file.open("rb") as f:
+                if ijson is not None:
+                    servers = ijson.items(f, "servers.item", use_float=True)
+                else:
+                    servers = _json_loads(f.read()).get("servers", [])
+
+                enabled = [s for s in servers if s.get("enabled", True)]
+            configs = MCPServerListAdapter.validate_python(enabled)
+            _MANIFEST_CACHE[cache_key] = (mtime, configs)
+            return list(configs)
 
         except Exception as e:
             print(f"   [MCP] ❌ Manifest Parse Error: {e}")
@@ -106,7 +185,7 @@ class MCPClientManager:
         async with self._lock:
             if self._initialized: return
 
-            if not settings.MCP_ENABLED:
+            if not get_settings().MCP_ENABLED:
                 print("   [MCP] Integration Disabled via Settings.")
                 return
 
@@ -117,9 +196,14 @@ class MCPClientManager:
                 print("   [MCP] No active server configurations found.")
                 return
 
-            # Parallel connection attempts could be implemented here
-            for config in configs:
-                await self._connect_server(config)
+            # Handshake all nodes concurrently: wall time is the slowest link, not the sum
+            results = await asyncio.gather(
+                *(self._connect_server(config) for config in configs),
+                return_exceptions=True,
+            )
+            for config, result in zip(configs, results):
+                if isinstance(result, Exception):
+                    print(f"      ❌ Connection Failure [{config.name}]: {result}")
 
             # Telemetry
             connected = sum(1 for s in self.servers.values() if s.connected)
@@ -132,6 +216,7 @@ class MCPClientManager:
         """Establishes the transport layer to a single node."""
         connection = MCPServerConnection(config=config)
         self.servers[config.name] = connection
+        self._callables_cache = None
 
         try:
             print(f"      🔗 Linking: {config.name} ({config.transport})...")
@@ -187,13 +272,23 @@ class MCPClientManager:
     async def _connect_http(self, connection: MCPServerConnection) -> None:
         """Protocol: Streamable HTTP."""
         from mcp import ClientSession
-        from mcp.client.streamable_http import streamablehttp_client
 
         if not connection.config.url:
             raise ValueError("HTTP transport requires 'url'")
 
-        client_cm = streamablehttp_client(connection.config.url)
-        read_stream, write_stream, _ = await client_cm.__aenter__()
+        try:
+            from mcp.client.streamable_http import create_mcp_http_client, streamable_http_client
+        except ImportError:
+            # Older SDKs own their httpx client per transport, so there is nothing to share
+            from mcp.client.streamable_http import streamablehttp_client
+            client_cm = streamablehttp_client(connection.config.url)
+        else:
+            if self._http_client is None:
+                self._http_client = create_mcp_http_client()
+            client_cm = streamable_http_client(connection.config.url, http_client=self._http_client)
+
+        streams = await client_cm.__aenter__()
+        read_stream, write_stream = streams[0], streams[1]
 
         connection.read_stream = read_stream
         connection.write_stream = write_stream
@@ -215,74 +310,92 @@ class MCPClientManager:
         if not connection.session: return
 
         try:
-            tools_response = await connection.session.list_tools()
-            
-            for tool in tools_response.tools:
-                mcp_tool = MCPTool(
-                    name=tool.name,
-                    description=tool.description or "No description.",
-                    server_name=connection.config.name,
-                    input_schema=tool.inputSchema or {},
-                    original_name=tool.name,
-                )
+            cache_key = (self.tool_prefix, connection.config.model_dump_json())
+            cached = _TOOLS_CACHE.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < _TOOLS_TTL:
+                discovered = cached[1]
+            else:
+                tools_response = await connection.session.list_tools()
+                discovered = []
+                for tool in tools_response.tools:
+                    mcp_tool = MCPTool(
+                        name=tool.name,
+                        description=tool.description or "No description.",
+                        server_name=connection.config.name,
+                        input_schema=tool.inputSchema or {},
+                        original_name=tool.name,
+                    )
+                    mcp_tool.prefixed_name = mcp_tool.get_prefixed_name(self.tool_prefix)
+                    discovered.append(mcp_tool)
+                _TOOLS_CACHE[cache_key] = (time.monotonic(), discovered)
+
+            for mcp_tool in discovered:
                 connection.tools.append(mcp_tool)
+                self.server_descriptions[mcp_tool.prefixed_name] = self._describe_tool(connection, mcp_tool)
+            self._callables_cache = None
         except Exception as e:
             print(f"      ⚠️ Discovery Error [{connection.config.name}]: {e}")
 
+    def _describe_tool(self, connection: MCPServerConnection, tool: MCPTool) -> str:
+        """Renders the prompt-facing docstring for a remote tool."""
+        return (
+            f"EXTERNAL TOOL [MCP:{connection.config.name}]\n"
+            f"{tool.description}\n"
+            f"Input Schema: {tool.schema_json}"
+        )
+
     def get_all_tools_as_callables(self) -> Dict[str, Callable[..., Any]]:
-        """Synthesizes Python callables from MCP definitions."""
+        """Synthesizes Python callables from MCP definitions (memoized until reconnect/shutdown)."""
+        if self._callables_cache is not None:
+            return self._callables_cache
+
         callables: Dict[str, Callable[..., Any]] = {}
         for connection in self.servers.values():
             if not connection.connected: continue
 
             for tool in connection.tools:
-                prefixed_name = tool.get_prefixed_name(self.tool_prefix)
-                callables[prefixed_name] = self._create_tool_wrapper(connection, tool)
+                prefixed_name = tool.prefixed_name or tool.get_prefixed_name(self.tool_prefix)
+                callables[prefixed_name] = self._create_tool_wrapper(connection, tool, prefixed_name)
+        self._callables_cache = callables
         return callables
 
-    def _create_tool_wrapper(self, connection: MCPServerConnection, tool: MCPTool) -> Callable[..., Any]:
-        """Creates a closure that acts as the local proxy for the remote tool."""
-        
-        async def tool_proxy(**kwargs: Any) -> Any:
-            if not connection.connected or not connection.session:
-                return "Error: Connection lost."
-            
-            try:
-                result = await connection.session.call_tool(tool.original_name, arguments=kwargs)
-                
-                # Unpack standard MCP content types
-                if hasattr(result, "content") and result.content:
-                    contents = []
-                    for content in result.content:
-                        if hasattr(content, "text"): contents.append(content.text)
-                        elif hasattr(content, "data"): contents.append(f"<Binary Data: {len(content.data)} bytes>")
-                    return "\n".join(contents) if contents else str(result)
-                
-                return str(result)
-            except Exception as e:
-                return f"MCP Execution Error: {e}"
-
+    def _create_tool_wrapper(
+        self, connection: MCPServerConnection, tool: MCPTool, prefixed_name: Optional[str] = None
+    ) -> Callable[..., Any]:
+        """Creates the local proxy object for the remote tool."""
+        prefixed_name = prefixed_name or tool.prefixed_name or tool.get_prefixed_name(self.tool_prefix)
         # Prompt Engineering Metadata
-        tool_proxy.__name__ = tool.get_prefixed_name(self.tool_prefix)
-        tool_proxy.__doc__ = (
-            f"EXTERNAL TOOL [MCP:{connection.config.name}]\n"
-            f"{tool.description}\n"
-            f"Input Schema: {json.dumps(tool.input_schema)}"
-        )
-        
-        return tool_proxy
+        doc = self.server_descriptions.get(prefixed_name) or self._describe_tool(connection, tool)
+        return MCPToolProxy(connection, tool, prefixed_name, doc)
 
-    async def shutdown(self) -> None:
-        """Terminates all connections."""
-        for name, connection in self.servers.items():
+    async def _close_one(self, connection: MCPServerConnection) -> None:
+        """Tears down a single node's session and transport, swallowing errors."""
+        try:
+            if connection.session:
+                await connection.session.__aexit__(None, None, None)
+            if connection._client_cm:
+                await connection._client_cm.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """Terminates all connections concurrently, bounded by `timeout` seconds."""
+        closers = [self._close_one(c) for c in self.servers.values()]
+        if closers:
+            try:
+                # stdio children may not exit cleanly; don't let one hang teardown
+                await asyncio.wait_for(asyncio.gather(*closers, return_exceptions=True), timeout=timeout)
+            except asyncio.TimeoutError:
+                print(f"   [MCP] ⚠️ Shutdown timed out after {timeout:.0f}s.")
+        if self._http_client is not None:
             try:
-                if connection.session:
-                    await connection.session.__aexit__(None, None, None)
-                if connection._client_cm:
-                    await connection._client_cm.__aexit__(None, None, None)
+                await self._http_client.aclose()
             except Exception:
                 pass
+            self._http_client = None
         self.servers.clear()
+        self.server_descriptions.clear()
+        self._callables_cache = None
         self._initialized = False
 
 # ------------------------------------------------------------------------------
@@ -293,32 +406,25 @@ class MCPClientManagerSync:
     """
     Synchronous Interface for the MCP Manager.
     Required because the Agent Kernel operates on a blocking event loop.
+
+    All MCP I/O runs on one persistent background event loop, so sessions are
+    always driven by the loop that created them, whichever thread calls in.
     """
 
     def __init__(self, config_path: Optional[str] = None) -> None:
         self._async_manager = MCPClientManager(config_path)
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_loop = asyncio.new_event_loop()
+        self._bg_thread = threading.Thread(target=self._bg_loop.run_forever, name="mcp-bridge", daemon=True)
+        self._bg_thread.start()
 
-    def _get_loop(self) -> asyncio.AbstractEventLoop:
-        """Safely retrieves or creates an event loop."""
-        try:
-            return asyncio.get_running_loop()
-        except RuntimeError:
-            if self._loop is None or self._loop.is_closed():
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
-            return self._loop
+    def _run(self, coro: Any) -> Any:
+        """Schedules a coroutine on the bridge loop and blocks for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._bg_loop).result()
 
     def initialize(self) -> None:
         """Sync wrapper for init."""
         try:
-            loop = self._get_loop()
-            if loop.is_running():
-                # If we are already in an async context, we shouldn't be here ideally,
-                # but if we are, we use create_task (not implemented here for simplicity)
-                print("   [MCP] ⚠️ Warning: Running sync init in active loop.")
-            else:
-                loop.run_until_complete(self._async_manager.initialize())
+            self._run(self._async_manager.initialize())
         except Exception as e:
             print(f"   [MCP] Init Failed: {e}")
 
@@ -328,22 +434,28 @@ class MCPClientManagerSync:
         sync_map: Dict[str, Callable[..., Any]] = {}
 
         for name, afn in async_map.items():
-            def sync_proxy(**kwargs: Any) -> Any:
-                loop = self._get_loop()
-                if loop.is_running():
-                    # Handle nested loop case roughly
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as pool:
-                        return pool.submit(asyncio.run, afn(**kwargs)).result()
-                return loop.run_until_complete(afn(**kwargs))
-            
-            sync_proxy.__name__ = afn.__name__
-            sync_proxy.__doc__ = afn.__doc__
-            sync_map[name] = sync_proxy
+            sync_map[name] = self._make_sync_proxy(afn)
             
         return sync_map
 
+    def _make_sync_proxy(self, afn: Callable[..., Any]) -> Callable[..., Any]:
+        """Builds a blocking proxy bound to exactly one async tool."""
+        run = self._run
+
+        def sync_proxy(**kwargs: Any) -> Any:
+            return run(afn(**kwargs))
+
+        sync_proxy.__name__ = afn.__name__
+        sync_proxy.__doc__ = afn.__doc__
+        return sync_proxy
+
     def shutdown(self) -> None:
-        loop = self._get_loop()
-        if not loop.is_running():
-            loop.run_until_complete(self._async_manager.shutdown())
+        if self._bg_loop.is_closed():
+            return
+        try:
+            self._run(self._async_manager.shutdown())
+        finally:
+            self._bg_loop.call_soon_threadsafe(self._bg_loop.stop)
+            self._bg_thread.join(timeout=5.0)
+            if not self._bg_loop.is_running():
+                self._bg_loop.close()
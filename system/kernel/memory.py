@@ -4,26 +4,37 @@
 Designation: Sys/Kernel/Memory
 Purpose: Manages long-term and short-term context for the Agent.
 Capabilities:
-- Persistent JSON storage in `artifacts/memory/`.
+- Persistent JSON storage in `artifacts/memory/` (snapshot + append-only journal).
 - Recursive context summarization.
 - Context window management for LLM context limits.
 """
 
-import json
 import os
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+    _json_loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+    _json_dumps: Callable[[Any], bytes] = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
 # Internal Imports
 try:
-    from system.config import settings
+    from system.config import get_settings
 except ImportError:
     # Fallback for legacy imports
     sys.path.append(str(Path(__file__).parent.parent.parent))
-    from system.config import settings
+    from system.config import get_settings
 
 class MemoryEntry(BaseModel):
     """A single interaction event in the cognitive stream."""
@@ -36,11 +47,16 @@ class MemoryState(BaseModel):
     """The complete persistent state of the Agent's memory."""
     summary: str = ""
     history: List[MemoryEntry] = Field(default_factory=list)
+    summarized: int = 0  # Count of leading history entries already folded into `summary`
+    journal_seq: int = 0  # Sequence number of the last journal record folded into this snapshot
 
 class MemoryManager:
     """
     Manages the Agent's cognitive history using a recursive summary buffer approach.
     Stores data in `artifacts/memory/agent_memory.json`.
+
+    New entries and summary updates are appended to a `.jsonl` journal next to the
+    snapshot; the full snapshot is only rewritten every `MEMORY_SNAPSHOT_INTERVAL` records.
     """
 
     def __init__(self, memory_file: Optional[str] = None) -> None:
@@ -54,35 +70,96 @@ class MemoryManager:
 
         # Ensure directory exists
         self.memory_path.parent.mkdir(parents=True, exist_ok=True)
+        self._journal_path = self.memory_path.with_suffix(".jsonl")
+        self._journaled = 0  # Records in the journal not yet folded into the snapshot
+        self._seq = 0  # Sequence number of the last journal record written or replayed
 
         self.state = MemoryState()
         self._load_memory()
 
     def _load_memory(self) -> None:
+        """Loads the snapshot, then replays the journal on top of it."""
+        self._load_snapshot()
+        self._seq = self.state.journal_seq
+        try:
+            self._replay_journal()
+        except Exception as e:
+            print(f"   [MEMORY] ⚠️ Journal Replay Error: {e}.")
+
+    def _load_snapshot(self) -> None:
         """Loads memory from the JSON substrate using Pydantic for validation."""
         if not self.memory_path.exists():
             return
 
         try:
-            content = self.memory_path.read_text(encoding='utf-8')
+            content = self.memory_path.read_bytes()
             if not content.strip():
                 return
 
-            data = json.loads(content)
+            data = _json_loads(content)
             self.state = MemoryState.model_validate(data)
                 
         except Exception as e:
             print(f"   [MEMORY] ⚠️ Load Error: {e}. Starting fresh.")
             self.state = MemoryState()
 
+    def _replay_journal(self) -> None:
+        """
+        Re-applies records journaled since the last snapshot. Records the snapshot already
+        holds (a crash between the snapshot swap and the journal unlink) are skipped by `seq`.
+        """
+        if not self._journal_path.exists():
+            return
+
+        with open(self._journal_path, 'rb') as f:
+            for line in f:
+                try:
+                    record = _json_loads(line)
+                    seq = record.pop("seq", None)
+                    if seq is not None:
+                        if seq <= self.state.journal_seq:
+                            continue
+                        self._seq = max(self._seq, seq)
+                    if "summary" in record:
+                        self.state.summary = record["summary"]
+                        self.state.summarized = record["summarized"]
+                    else:
+                        self.state.history.append(MemoryEntry.model_validate(record))
+                    self._journaled += 1
+                except (ValueError, KeyError, TypeError):
+                    # A torn final line from an interrupted append; everything before it is intact
+                    print("   [MEMORY] ⚠️ Skipping corrupt journal line.")
+
     def save_memory(self) -> None:
-        """Persists the current cognitive state."""
+        """Persists the full cognitive state as a snapshot and retires the journal."""
+        tmp_path = self.memory_path.with_suffix(".tmp")
         try:
-            with open(self.memory_path, 'w', encoding='utf-8') as f:
-                json.dump(self.state.model_dump(), f, indent=2, ensure_ascii=False)
+            # Write aside, then atomically swap in: a crash never leaves a truncated snapshot
+            self.state.journal_seq = self._seq
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(self.state.model_dump()))
+            os.replace(tmp_path, self.memory_path)
+            self._journal_path.unlink(missing_ok=True)
+            self._journaled = 0
         except Exception as e:
             print(f"   [MEMORY] ❌ Write Error: {e}")
 
+    def _append_journal(self, record: Dict[str, Any]) -> None:
+        """
+        Appends one record to the journal: O(1) bytes per turn instead of O(history).
+        A record is either a dumped MemoryEntry or a `{"summary", "summarized"}` update,
+        tagged with a monotonically increasing `seq`.
+        """
+        try:
+            self._seq += 1
+            with open(self._journal_path, 'ab') as f:
+                f.write(_json_dumps({"seq": self._seq, **record}) + b"\n")
+            self._journaled += 1
+        except Exception as e:
+            print(f"   [MEMORY] ❌ Journal Write Error: {e}")
+        if self._journaled >= get_settings().MEMORY_SNAPSHOT_INTERVAL:
+            self.save_memory()  # Compact: fold the journal into a fresh snapshot
+
     def add_entry(self, role: str, content: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Injects a new interaction event into the stream."""
         entry = MemoryEntry(
@@ -91,7 +168,7 @@ class MemoryManager:
             metadata=metadata or {}
         )
         self.state.history.append(entry)
-        self.save_memory()
+        self._append_journal(entry.model_dump())
 
     @property
     def history(self) -> List[MemoryEntry]:
@@ -105,9 +182,9 @@ class MemoryManager:
 
     @summary.setter
     def summary(self, value: str) -> None:
-        """Updates the current context summary."""
+        """Updates the current context summary (journaled; the snapshot is not rewritten)."""
         self.state.summary = value
-        self.save_memory()
+        self._append_journal({"summary": value, "summarized": self.state.summarized})
 
     def _default_summarizer(self, old_entries: List[MemoryEntry], previous_summary: str) -> str:
         """Fallback deterministic summarizer."""
@@ -140,18 +217,22 @@ class MemoryManager:
         
         # If history fits in window, return all
         if len(full_history) <= max_messages:
-            return context + [entry.model_dump(include={"role", "content"}) for entry in full_history]
+            return context + [{"role": e.role, "content": e.content} for e in full_history]
 
-        # Slice history
-        entries_to_summarize = full_history[:-max_messages]
-        recent_entries = full_history[-max_messages:]
+        # Slice history: only the window tail is copied eagerly
+        spill_end = len(full_history) - max_messages
+        recent_entries = full_history[spill_end:]
         
-        # Execute Summary
-        summarizer_fn = summarizer or self._default_summarizer
-        try:
-            self.summary = summarizer_fn(entries_to_summarize, self.summary)
-        except Exception as e:
-            print(f"   [MEMORY] ⚠️ Summary Failed: {e}")
+        # Execute Summary, folding in just the entries that spilled out since the last pass
+        if spill_end > self.state.summarized:
+            entries_to_summarize = list(islice(full_history, self.state.summarized, spill_end))
+            summarizer_fn = summarizer or self._default_summarizer
+            try:
+                new_summary = summarizer_fn(entries_to_summarize, self.summary)
+                self.state.summarized = spill_end
+                self.summary = new_summary
+            except Exception as e:
+                print(f"   [MEMORY] ⚠️ Summary Failed: {e}")
         
         # Inject Summary
         if self.summary:
@@ -160,7 +241,7 @@ class MemoryManager:
                 "content": f"PREVIOUS CONTEXT SUMMARY:\n{self.summary}"
             })
             
-        return context + [entry.model_dump(include={"role", "content"}) for entry in recent_entries]
+        return context + [{"role": e.role, "content": e.content} for e in recent_entries]
 
     def clear_memory(self) -> None:
         """Performs a lobotomy (Factory Reset)."""
@@ -0,0 +1,155 @@
+"""
+📬 Tool Dispatch Queue.
+
+Designation: Sys/Kernel/ToolQueue
+Purpose: Batches pending tool calls and dispatches each batch concurrently.
+Capabilities:
+- Collects up to `MAX_BATCH` requests within a `BATCH_WINDOW_MS` window.
+- Runs a batch's blocking tools side by side on worker threads.
+- Runs tools that swap process-global state (e.g. the sandbox's stdout redirect) alone.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Most requests dispatched together in one batch
+MAX_BATCH = 16
+# How long the worker waits for a batch to fill after its first request arrives
+BATCH_WINDOW_MS = 20
+# Tools that must never overlap: execute_python_code redirects sys.stdout process-wide
+_EXCLUSIVE = frozenset({"execute_python_code"})
+
+# (fn, args, kwargs)
+_Call = Tuple[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]
+# (future, fn, args, kwargs)
+_Request = Tuple["asyncio.Future[Any]", Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]
+
+
+def _call_all(calls: Iterable[_Call]) -> List[Tuple[bool, Any]]:
+    """Runs `calls` back to back on the calling thread, capturing each outcome."""
+    outcomes: List[Tuple[bool, Any]] = []
+    for fn, args, kwargs in calls:
+        try:
+            outcomes.append((True, fn(*args, **kwargs)))
+        except Exception as e:
+            outcomes.append((False, e))
+    return outcomes
+
+
+class ToolQueue:
+    """
+    An asyncio message queue in front of the (blocking) tool functions.
+
+    `put()` enqueues a call and returns a Future for its result. A single worker task
+    drains the queue in batches and runs the batch's regular requests concurrently via
+    `asyncio.to_thread`. Exclusive tools then run one by one on a single thread, once the
+    rest of the batch has finished; batches never overlap, so nothing else the queue
+    dispatches runs alongside an exclusive tool.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = MAX_BATCH,
+        window_ms: float = BATCH_WINDOW_MS,
+        exclusive: Iterable[str] = _EXCLUSIVE
+    ) -> None:
+        self.max_batch = max(1, max_batch)
+        self.window = window_ms / 1000
+        self.exclusive = frozenset(exclusive)
+        self._queue: Optional["asyncio.Queue[_Request]"] = None
+        self._worker_task: Optional["asyncio.Task[None]"] = None
+        # The batch the worker has taken off the queue and not yet resolved
+        self._inflight: List[_Request] = []
+
+    def put(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "asyncio.Future[Any]":
+        """Enqueues `fn(*args, **kwargs)`. Must be called from a running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._worker_task is None or self._worker_task.done() or self._worker_task.get_loop() is not loop:
+            # (Re)start on this loop; a Queue cannot be shared across loops
+            self._queue = asyncio.Queue()
+            self._worker_task = loop.create_task(self._worker())
+
+        future: "asyncio.Future[Any]" = loop.create_future()
+        assert self._queue is not None
+        self._queue.put_nowait((future, fn, args, kwargs))
+        return future
+
+    async def close(self) -> None:
+        """Stops the worker. Requests still queued or mid-dispatch are cancelled."""
+        task, self._worker_task = self._worker_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # Taken off the queue but unresolved: the worker was filling or dispatching this batch
+        for future, *_ in self._inflight:
+            future.cancel()  # No-op for futures already resolved
+        self._inflight = []
+        while self._queue is not None and not self._queue.empty():
+            self._queue.get_nowait()[0].cancel()
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            self._inflight = batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._dispatch(batch)
+            self._inflight = []
+
+    async def _dispatch(self, batch: List[_Request]) -> None:
+        serial = [r for r in batch if getattr(r[1], "__name__", "") in self.exclusive]
+        concurrent = [r for r in batch if getattr(r[1], "__name__", "") not in self.exclusive]
+        await asyncio.gather(*(self._run([r]) for r in concurrent))
+        # Only after the concurrent group is done: their prints must not land in a redirect
+        if serial:
+            await self._run(serial)
+
+    @staticmethod
+    async def _run(requests: List[_Request]) -> None:
+        outcomes = await asyncio.to_thread(_call_all, [r[1:] for r in requests])
+        for (future, *_), (ok, value) in zip(requests, outcomes):
+            if future.done():  # Cancelled by the caller meanwhile
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+async def _run_batched(calls: List[_Call]) -> List[Any]:
+    queue = ToolQueue()
+    try:
+        futures = [queue.put(fn, *args, **kwargs) for fn, args, kwargs in calls]
+        return list(await asyncio.gather(*futures, return_exceptions=True))
+    finally:
+        await queue.close()
+
+
+def run_tools(calls: List[_Call]) -> List[Any]:
+    """
+    Blocking entrypoint: runs `(fn, args, kwargs)` calls through a ToolQueue.
+
+    Returns one result per call, in call order; a call that raised yields its exception.
+    When an event loop is already running on this thread (we cannot block it), the calls
+    fall back to direct synchronous execution with the same result shape.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_run_batched(calls))
+    return [value for _, value in _call_all(calls)]
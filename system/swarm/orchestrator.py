@@ -4,17 +4,20 @@
 Designation: Sys/Swarm/Orchestrator
 Purpose: Implements the Router-Worker pattern for parallel task execution.
 Capabilities:
-- Dynamic Worker Discovery.
+- Dynamic Worker Discovery (lazily imported on first dispatch).
 - Message Bus for context sharing.
-- Fault-tolerant delegation loop.
+- Fault-tolerant delegation loop (independent steps run concurrently).
 """
 
+import asyncio
 import importlib
 import importlib.util
 import pkgutil
 import sys
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, cast
+from typing import Any, DefaultDict, Deque, Dict, List, Optional, Tuple, Type, cast
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -36,6 +39,11 @@ class MessageBus:
     
     def __init__(self) -> None:
         self._ledger: List[SwarmMessage] = []
+        # Per-participant index, kept in send order, so lookups skip the full ledger
+        self._by_agent: DefaultDict[str, Deque[SwarmMessage]] = defaultdict(deque)
+        # Generation-stamped snapshots: get_context rebuilds a view only after the agent saw new traffic
+        self._gen: DefaultDict[str, int] = defaultdict(int)
+        self._cache: Dict[str, Tuple[int, List[SwarmMessage]]] = {}
     
     def send(self, sender: str, recipient: str, msg_type: str, content: str) -> None:
         msg = SwarmMessage(
@@ -45,16 +53,35 @@ class MessageBus:
             content=str(content)
         )
         self._ledger.append(msg)
+        self._by_agent[sender].append(msg)
+        self._gen[sender] += 1
+        if recipient != sender:
+            self._by_agent[recipient].append(msg)
+            self._gen[recipient] += 1
     
     def get_context(self, agent_name: str) -> List[SwarmMessage]:
-        """Retrieves messages where the agent is sender or recipient."""
-        return [m for m in self._ledger if m.sender == agent_name or m.recipient == agent_name]
+        """
+        Retrieves messages where the agent is sender or recipient.
+        The returned list is a shared snapshot; treat it as read-only.
+        """
+        gen = self._gen.get(agent_name, 0)
+        cached = self._cache.get(agent_name)
+        if cached is not None and cached[0] == gen:
+            return cached[1]
+
+        view = list(self._by_agent.get(agent_name, ()))
+        self._cache[agent_name] = (gen, view)
+        return view
     
     def dump(self) -> List[Dict[str, Any]]:
-        return [m.model_dump() for m in self._ledger]
+        # Flat str fields only: a shallow copy of __dict__ equals model_dump() without the serializer pass
+        return [dict(m.__dict__) for m in self._ledger]
     
     def clear(self) -> None:
         self._ledger = []
+        self._by_agent.clear()
+        self._gen.clear()
+        self._cache.clear()
 
 class SwarmOrchestrator:
     """
@@ -67,13 +94,16 @@ class SwarmOrchestrator:
         self.bus = MessageBus()
         self.workers: Dict[str, Any] = {}
         self.router: Any = None
+        self._catalog: Dict[str, Path] = {}
         
         self._recruit_agents()
 
     def _recruit_agents(self) -> None:
         """
-        Dynamically discovers and loads agent classes from system/swarm/agents/.
+        Dynamically discovers agent modules in src/agents/.
         Allows the system to 'grow' new agents without code changes here.
+        Only the Router is imported now; workers are catalogued by role and
+        imported on first dispatch (see `_get_or_load_worker`).
         """
         # Define path to agents directory
         root = Path(__file__).parent.parent.parent
@@ -87,40 +117,141 @@ class SwarmOrchestrator:
         if str(root) not in sys.path:
             sys.path.append(str(root))
 
-        for file_path in agents_dir.glob("*_agent.py"):
-            module_name = file_path.stem
-            try:
-                # Import module: system.swarm.agents.coder_agent
-                full_module_name = f"src.agents.{module_name}"
-                spec = importlib.util.spec_from_file_location(full_module_name, file_path)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    # Find class ending in 'Agent'
-                    for attr_name in dir(module):
-                        if attr_name.endswith("Agent") and attr_name != "BaseAgent":
-                            agent_class = getattr(module, attr_name)
-                            instance = agent_class()
+        for file_path in agents_dir.iterdir():
+            if not file_path.name.endswith("_agent.py"):
+                continue
+            # Infer role from filename: coder_agent -> coder
+            role = file_path.stem.replace("_agent", "")
+            if role == "router":
+                self._load_agents(file_path)
+            else:
+                self._catalog[role] = file_path
+                print(f"      📇 Worker Catalogued: {role.upper()}")
+
+    def _load_agents(self, file_path: Path) -> None:
+        """Imports one agent module and instantiates every Agent class it defines."""
+        module_name = file_path.stem
+        try:
+            # Import module: src.agents.coder_agent
+            full_module_name = f"src.agents.{module_name}"
+            spec = importlib.util.spec_from_file_location(full_module_name, file_path)
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                
+                # Find class ending in 'Agent'
+                for attr_name in dir(module):
+                    if attr_name.endswith("Agent") and attr_name != "BaseAgent":
+                        agent_class = getattr(module, attr_name)
+                        instance = agent_class()
+                        
+                        # Router is special
+                        if "Router" in attr_name:
+                            self.router = instance
+                            print(f"      👑 Router Online: {attr_name}")
+                        else:
+                            role = module_name.replace("_agent", "")
+                            self.workers[role] = instance
+                            print(f"      👷 Worker Online: {role.upper()}")
                             
-                            # Router is special
-                            if "Router" in attr_name:
-                                self.router = instance
-                                print(f"      👑 Router Online: {attr_name}")
-                            else:
-                                # Infer role from filename: coder_agent -> coder
-                                role = module_name.replace("_agent", "")
-                                self.workers[role] = instance
-                                print(f"      👷 Worker Online: {role.upper()}")
-                                
-            except Exception as e:
-                print(f"   ⚠️ Failed to recruit {module_name}: {e}")
+        except Exception as e:
+            print(f"   ⚠️ Failed to recruit {module_name}: {e}")
+
+    def _get_or_load_worker(self, role: str) -> Any:
+        """Returns the worker for `role`, importing its module on first use."""
+        worker = self.workers.get(role)
+        if worker is None:
+            file_path = self._catalog.pop(role, None)
+            if file_path is not None:
+                self._load_agents(file_path)
+                worker = self.workers.get(role)
+        return worker
 
     def execute(self, task: str, verbose: bool = True) -> str:
+        """
+        Blocking entrypoint; drives `aexecute` on a fresh event loop.
+        Called from inside a running loop (where `asyncio.run` cannot nest), that fresh loop
+        runs on a helper thread instead. Async callers should prefer `await aexecute(...)`.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aexecute(task, verbose=verbose))
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="swarm-execute") as pool:
+            return pool.submit(asyncio.run, self.aexecute(task, verbose=verbose)).result()
+
+    @staticmethod
+    def _plan_levels(delegation_plan: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        Groups plan steps into dependency levels; every step in a level may run concurrently.
+        `depends_on` lists 1-based step numbers (list or comma-separated string). Only earlier
+        steps can be depended on, and repeat visits to the same worker stay in plan order.
+        """
+        depth: List[int] = []
+        last_for_worker: Dict[str, int] = {}
+
+        for idx, step in enumerate(delegation_plan):
+            raw = step.get('depends_on') or []
+            refs = raw.split(',') if isinstance(raw, str) else raw
+            deps = set()
+            for ref in refs:
+                try:
+                    dep = int(ref) - 1
+                except (TypeError, ValueError):
+                    continue
+                if 0 <= dep < idx:
+                    deps.add(dep)
+
+            worker_role = step.get('agent', '')
+            if worker_role in last_for_worker:
+                deps.add(last_for_worker[worker_role])
+            last_for_worker[worker_role] = idx
+
+            depth.append(1 + max((depth[d] for d in deps), default=-1))
+
+        levels: List[List[int]] = [[] for _ in range(max(depth, default=-1) + 1)]
+        for idx, level in enumerate(depth):
+            levels[level].append(idx)
+        return levels
+
+    async def _run_step(
+        self, idx: int, step: Dict[str, Any], results: List[str], verbose: bool
+    ) -> None:
+        """Executes one delegation step on a worker thread and records its outcome in `results[idx]`."""
+        worker_role = step.get('agent', '')
+        sub_task = step.get('task', '')
+
+        worker = self._get_or_load_worker(worker_role)
+        if not worker:
+            results[idx] = f"Error: Worker '{worker_role}' unavailable."
+            return
+
+        if verbose: print(f"      👉 Delegating to [{worker_role.upper()}]: {sub_task}")
+        
+        self.bus.send("router", worker_role, "task", sub_task)
+        
+        try:
+            # Pass context if supported
+            ctx = self.bus.get_context(worker_role)
+            # Convert context to expected format for agents
+            agent_ctx = [{"from": m.sender, "content": m.content} for m in ctx]
+            
+            # Execute (sync workers run in the default thread pool so I/O-bound steps overlap)
+            outcome = str(await asyncio.to_thread(worker.execute, sub_task, context=agent_ctx))
+                
+            results[idx] = outcome
+            self.bus.send(worker_role, "router", "result", outcome)
+            
+        except Exception as e:
+            err = f"Worker {worker_role} Failed: {e}"
+            results[idx] = err
+            self.bus.send(worker_role, "router", "error", err)
+
+    async def aexecute(self, task: str, verbose: bool = True) -> str:
         """
         Main Swarm Execution Loop.
         1. Router decomposes task.
-        2. Workers execute sub-tasks.
+        2. Workers execute sub-tasks, one dependency level at a time.
         3. Router synthesizes results.
         """
         if not self.router:
@@ -130,43 +261,17 @@ class SwarmOrchestrator:
         
         # 1. Delegation Phase
         try:
-            delegation_plan: List[Dict[str, str]] = self.router.analyze_and_delegate(task)
+            delegation_plan: List[Dict[str, Any]] = self.router.analyze_and_delegate(task)
         except Exception as e:
             return f"Router Panic: {e}"
 
-        results: List[str] = []
+        results: List[str] = [""] * len(delegation_plan)
         
-        # 2. Execution Phase
-        for step in delegation_plan:
-            worker_role = step.get('agent', '')
-            sub_task = step.get('task', '')
-            
-            worker = self.workers.get(worker_role)
-            if not worker:
-                err = f"Error: Worker '{worker_role}' unavailable."
-                results.append(err)
-                continue
-            
-            if verbose: print(f"      👉 Delegating to [{worker_role.upper()}]: {sub_task}")
-            
-            self.bus.send("router", worker_role, "task", sub_task)
-            
-            try:
-                # Pass context if supported
-                ctx = self.bus.get_context(worker_role)
-                # Convert context to expected format for agents
-                agent_ctx = [{"from": m.sender, "content": m.content} for m in ctx]
-                
-                # Execute
-                outcome = str(worker.execute(sub_task, context=agent_ctx))
-                    
-                results.append(outcome)
-                self.bus.send(worker_role, "router", "result", outcome)
-                
-            except Exception as e:
-                err = f"Worker {worker_role} Failed: {e}"
-                results.append(err)
-                self.bus.send(worker_role, "router", "error", err)
+        # 2. Execution Phase: independent steps in a level run concurrently
+        for level in self._plan_levels(delegation_plan):
+            await asyncio.gather(
+                *(self._run_step(idx, delegation_plan[idx], results, verbose) for idx in level)
+            )
 
         # 3. Synthesis Phase
         if verbose: print("      🔄 Synthesizing Intelligence...")
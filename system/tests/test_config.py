@@ -0,0 +1,17 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+
+
+def test_importing_the_kernel_does_not_build_settings() -> None:
+    code = (
+        "import system.kernel.agent, system.kernel.mcp_client, system.tools.openai_compat\n"
+        "import src.agents.base_agent\n"
+        "import system.config as config\n"
+        "assert config._settings is None, 'Settings built at import time'\n"
+        "assert config.get_settings() is config.settings\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,39 @@
+from system.tools import dev_skills
+
+
+def test_bulk_mastery_matches_single_checks() -> None:
+    names = ["Nguyen Van A", "Tran Van B", "Nguyen Van A", "Ghost"]
+    brands = ["Morita", "Morita", "Unknown", "Mectron"]
+
+    results = dev_skills.check_technical_mastery_bulk(names, brands, required_level=3)
+
+    assert results == [
+        dev_skills.check_technical_mastery(name, brand, required_level=3) for name, brand in zip(names, brands)
+    ]
+    assert [r["is_qualified"] for r in results] == [True, False, False, False]
+    assert [r["current_mastery"] for r in results] == [5, 2, 0, 0]
+
+
+def test_bulk_mastery_rejects_unpaired_input() -> None:
+    assert dev_skills.check_technical_mastery_bulk(["Tran Van B"], []) == [
+        {"status": "error", "message": "technician_names and brands must have the same length."}
+    ]
+
+
+def test_coding_session_walks_plan_implement_verify() -> None:
+    session = dev_skills.autonomous_coding_session("login")
+
+    assert session["status"] == "success"
+    assert session["iterations_used"] == 3
+    assert session["history"] == [
+        {"step": 1, "action": "plan", "details": "Decomposed objective: login"},
+        {"step": 2, "action": "implement", "details": "Generated code for login"},
+        {"step": 3, "action": "verify", "details": "Tests passed."},
+    ]
+
+
+def test_coding_session_respects_max_iterations() -> None:
+    session = dev_skills.autonomous_coding_session("login", max_iterations=2)
+    assert session["iterations_used"] == 2
+    assert [step["action"] for step in session["history"]] == ["plan", "implement"]
+    assert dev_skills.autonomous_coding_session("login", max_iterations=0)["history"] == []
@@ -0,0 +1,118 @@
+from typing import Any, List
+
+import pytest
+
+from system.tools import filesystem_tool
+
+
+@pytest.fixture
+def tree(tmp_path: Any) -> Any:
+    (tmp_path / "a.py").write_text("print('a')\n")
+    (tmp_path / "notes.md").write_text("# notes\n")
+    sub = tmp_path / "pkg"
+    sub.mkdir()
+    (sub / "b.py").write_text("x = 1\ny = 2\n")
+    deep = sub / "deep"
+    deep.mkdir()
+    (deep / "c.py").write_text("z = 3\n")
+    return tmp_path
+
+
+def _names(entries: List[Any]) -> List[str]:
+    return sorted(e["name"] for e in entries)
+
+
+def test_list_files_flat(tree: Any) -> None:
+    entries = filesystem_tool.list_files(str(tree))
+    assert _names(entries) == ["a.py", "notes.md", "pkg"]
+    by_name = {e["name"]: e for e in entries}
+    assert by_name["a.py"] == {
+        "path": str(tree / "a.py"), "name": "a.py", "is_dir": False, "size_bytes": 11, "extension": ".py"
+    }
+    assert by_name["pkg"]["is_dir"] is True
+    assert by_name["pkg"]["size_bytes"] == 0
+
+
+def test_list_files_recursive_filter_and_depth(tree: Any) -> None:
+    entries = filesystem_tool.list_files(str(tree), recursive=True, extensions=[".py"], max_depth=1)
+    assert _names(entries) == ["a.py", "b.py", "deep", "pkg"]
+
+    entries = filesystem_tool.list_files(str(tree), recursive=True, extensions=[".py"])
+    assert _names(entries) == ["a.py", "b.py", "c.py", "deep", "pkg"]
+    # Pre-order: a directory is listed before anything inside it
+    paths = [e["path"] for e in entries]
+    assert paths.index(str(tree / "pkg")) < paths.index(str(tree / "pkg" / "b.py"))
+
+
+def test_list_files_missing_directory(tmp_path: Any) -> None:
+    assert filesystem_tool.list_files(str(tmp_path / "nope")) == [
+        {"error": f"Directory not found: {tmp_path / 'nope'}"}
+    ]
+
+
+def test_list_files_entries_match_file_info_schema(tree: Any) -> None:
+    for entry in filesystem_tool.list_files(str(tree), recursive=True):
+        assert filesystem_tool.FileInfo.model_validate(entry).model_dump() == entry
+
+
+def test_search_pattern_reports_one_hit_per_line(tree: Any) -> None:
+    (tree / "multi.py").write_text("a = 1\nb = a + a\r\n\nc = 'a'")
+    results = filesystem_tool.search_pattern(str(tree), "a", extensions=[".py"], max_results=50)
+    hits = [(r["line_number"], r["content"]) for r in results if r["file"].endswith("multi.py")]
+    assert hits == [(1, "a = 1"), (2, "b = a + a"), (4, "c = 'a'")]
+
+
+def test_search_pattern_limits_and_misses(tree: Any) -> None:
+    assert len(filesystem_tool.search_pattern(str(tree), "=", max_results=2)) == 2
+    assert filesystem_tool.search_pattern(str(tree), "no-such-text") == []
+    (tree / "empty.py").write_text("")
+    assert filesystem_tool.search_pattern(str(tree), "x", extensions=[".py"]) == [
+        {"file": str(tree / "pkg" / "b.py"), "line_number": 1, "content": "x = 1"}
+    ]
+
+
+def test_search_pattern_prunes_vendored_dirs(tree: Any) -> None:
+    for name in ("node_modules", ".git"):
+        (tree / name).mkdir()
+        (tree / name / "hidden.py").write_text("needle\n")
+    (tree / "pkg" / "kept.py").write_text("needle\n")
+    results = filesystem_tool.search_pattern(str(tree), "needle", extensions=[".py"])
+    assert [r["file"] for r in results] == [str(tree / "pkg" / "kept.py")]
+
+
+def test_search_pattern_extension_filter_uses_suffix(tree: Any) -> None:
+    (tree / "foopy").write_text("needle\n")
+    (tree / ".py").write_text("needle\n")
+    (tree / "kept.py").write_text("needle\n")
+    for exts in ([".py"], ["py"]):
+        results = filesystem_tool.search_pattern(str(tree), "needle", extensions=exts)
+        assert [r["file"] for r in results] == [str(tree / "kept.py")]
+        assert _names(filesystem_tool.list_files(str(tree), extensions=exts)) == ["a.py", "kept.py", "pkg"]
+
+
+def test_search_patterns_single_pass(tree: Any) -> None:
+    (tree / "multi.py").write_text("foo bar foo\nfoobar\nnone\n")
+    results = filesystem_tool.search_patterns(str(tree), ["foo", "foobar", "bar"], extensions=[".py"])
+    hits = [(r["line_number"], r["pattern"]) for r in results if r["file"].endswith("multi.py")]
+    assert hits == [(1, "foo"), (1, "bar"), (2, "foo"), (2, "foobar"), (2, "bar")]
+
+    # Same (line, pattern) pairs as one search_pattern call per pattern
+    single = sorted(
+        (r["line_number"], p)
+        for p in ["foo", "foobar", "bar"]
+        for r in filesystem_tool.search_pattern(str(tree), p, extensions=[".py"])
+        if r["file"].endswith("multi.py")
+    )
+    assert sorted(hits) == single
+    assert filesystem_tool.search_patterns(str(tree), []) == []
+
+
+def test_read_file_truncates_with_remaining_count(tmp_path: Any) -> None:
+    target = tmp_path / "long.txt"
+    target.write_text("".join(f"line {i}\n" for i in range(10)))
+
+    assert filesystem_tool.read_file(str(target), max_lines=3) == (
+        "line 0\nline 1\nline 2\n\n... [Truncated: 7 more lines]"
+    )
+    assert filesystem_tool.read_file(str(target), max_lines=10).endswith("line 9")
+    assert filesystem_tool.read_file(str(tmp_path)).startswith("Error: Path is not a file")
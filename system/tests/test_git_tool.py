@@ -1,13 +1,32 @@
-from typing import Generator
+import os
+import subprocess
+from typing import Any, Dict, Generator
 import pytest
 from unittest.mock import patch, MagicMock
 from system.tools import git_tool
 
 @pytest.fixture
 def mock_subprocess() -> Generator[MagicMock, None, None]:
-    with patch("subprocess.run") as mock:
+    # Force the CLI path even when pygit2 is installed
+    with patch("subprocess.run") as mock, patch.object(git_tool, "_open_repo", return_value=None):
         yield mock
 
+def _run_kw() -> Dict[str, Any]:
+    return {**git_tool._RUN_KW, "env": {**os.environ, **git_tool._GIT_ENV_OVERRIDES}}
+
+def test_git_env_tracks_the_live_environment(mock_subprocess: MagicMock, monkeypatch: Any) -> None:
+    mock_subprocess.return_value.returncode = 0
+    mock_subprocess.return_value.stdout = ""
+    monkeypatch.setenv("GIT_DIR", "/elsewhere/.git")
+    monkeypatch.setenv("LC_ALL", "fr_FR.UTF-8")
+
+    git_tool.git_status()
+
+    env = mock_subprocess.call_args.kwargs["env"]
+    assert env["GIT_DIR"] == "/elsewhere/.git"
+    assert env["LC_ALL"] == "C"
+    assert env["GIT_OPTIONAL_LOCKS"] == "0"
+
 def test_git_status(mock_subprocess: MagicMock) -> None:
     mock_subprocess.return_value.returncode = 0
     mock_subprocess.return_value.stdout = "On branch main\nnothing to commit"
@@ -16,10 +35,11 @@ def test_git_status(mock_subprocess: MagicMock) -> None:
     
     assert "On branch main" in result
     mock_subprocess.assert_called_with(
-        ["git", "status"], 
+        [git_tool._GIT_BIN, "status"], 
         capture_output=True, 
         text=True, 
-        check=False
+        check=False,
+        env={**os.environ, "GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
     )
 
 def test_git_diff(mock_subprocess: MagicMock) -> None:
@@ -30,22 +50,19 @@ def test_git_diff(mock_subprocess: MagicMock) -> None:
     result = git_tool.git_diff()
     assert result == "diff output"
     mock_subprocess.assert_called_with(
-        ["git", "diff"],
-        capture_output=True, text=True, check=False
+        [git_tool._GIT_BIN, "diff"], **_run_kw()
     )
     
     # Test specific file diff
     git_tool.git_diff("file.txt")
     mock_subprocess.assert_called_with(
-        ["git", "diff", "file.txt"],
-        capture_output=True, text=True, check=False
+        [git_tool._GIT_BIN, "diff", "file.txt"], **_run_kw()
     )
     
     # Test staged diff
     git_tool.git_diff(staged=True)
     mock_subprocess.assert_called_with(
-        ["git", "diff", "--cached"],
-        capture_output=True, text=True, check=False
+        [git_tool._GIT_BIN, "diff", "--cached"], **_run_kw()
     )
 
 def test_git_commit(mock_subprocess: MagicMock) -> None:
@@ -55,15 +72,13 @@ def test_git_commit(mock_subprocess: MagicMock) -> None:
     # Test normal commit
     git_tool.git_commit("test commit")
     mock_subprocess.assert_called_with(
-        ["git", "commit", "-m", "test commit"],
-        capture_output=True, text=True, check=False
+        [git_tool._GIT_BIN, "commit", "-m", "test commit"], **_run_kw()
     )
     
     # Test commit -a
     git_tool.git_commit("test commit", add_all=True)
     mock_subprocess.assert_called_with(
-        ["git", "commit", "-a", "-m", "test commit"],
-        capture_output=True, text=True, check=False
+        [git_tool._GIT_BIN, "commit", "-a", "-m", "test commit"], **_run_kw()
     )
 
 def test_git_log(mock_subprocess: MagicMock) -> None:
@@ -73,8 +88,7 @@ def test_git_log(mock_subprocess: MagicMock) -> None:
     result = git_tool.git_log(2)
     assert "commit 1" in result
     mock_subprocess.assert_called_with(
-        ["git", "log", "-n 2", "--oneline"],
-        capture_output=True, text=True, check=False
+        [git_tool._GIT_BIN, "log", "-n", "2", "--no-color", "--abbrev=7", "--pretty=format:%h %s"], **_run_kw()
     )
 
 def test_git_error(mock_subprocess: MagicMock) -> None:
@@ -83,3 +97,52 @@ def test_git_error(mock_subprocess: MagicMock) -> None:
     
     result = git_tool.git_status()
     assert "Git Error (1): fatal: not a git repository" in result
+
+def test_git_log_inprocess_matches_oneline(tmp_path: Any, monkeypatch: Any) -> None:
+    pygit2 = pytest.importorskip("pygit2")
+    repo = pygit2.init_repository(str(tmp_path))
+    sig = pygit2.Signature("Dev", "dev@example.com")
+    parents: list = []
+    for msg in ["first", "second\n\nbody text", "third"]:
+        tree = repo.TreeBuilder().write()
+        parents = [repo.create_commit("HEAD", sig, sig, msg, tree, parents)]
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(git_tool, "_repos", {})
+    with patch("subprocess.run") as mock:
+        result = git_tool.git_log(2)
+    mock.assert_not_called()
+    head = repo[repo.head.target]
+    assert result == f"{head.short_id} third\n{repo[head.parent_ids[0]].short_id} second"
+    if git_tool._GIT_BIN:
+        assert result == subprocess.run(
+            [git_tool._GIT_BIN, "log", "-n", "2", "--abbrev=7", "--pretty=format:%h %s"],
+            cwd=tmp_path, capture_output=True, text=True, check=True,
+        ).stdout
+
+
+def test_short_id_extends_past_ambiguous_prefixes(tmp_path: Any) -> None:
+    pygit2 = pytest.importorskip("pygit2")
+    repo = pygit2.init_repository(str(tmp_path))
+    # Enough objects that some 4-hex prefixes collide: those ids need a longer abbreviation
+    by_prefix: dict = {}
+    for i in range(2000):
+        oid = str(repo.create_blob(str(i).encode()))
+        by_prefix.setdefault(oid[:4], []).append(oid)
+    clashing = next(oids for oids in by_prefix.values() if len(oids) > 1)
+    unique = next(oids[0] for oids in by_prefix.values() if len(oids) == 1)
+
+    assert len(git_tool._short_id(repo, clashing[0], 4)) > 4
+    assert git_tool._short_id(repo, unique, 4) == unique[:4]
+    if git_tool._GIT_BIN:
+        short = subprocess.run(
+            [git_tool._GIT_BIN, "rev-parse", "--short=4", clashing[0]],
+            cwd=tmp_path, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        assert git_tool._short_id(repo, clashing[0], 4) == short
+
+
+def test_git_missing(mock_subprocess: MagicMock, monkeypatch: Any) -> None:
+    monkeypatch.setattr(git_tool, "_GIT_BIN", None)
+    assert git_tool.git_status() == "Error: git executable not found in PATH."
+    mock_subprocess.assert_not_called()
@@ -0,0 +1,172 @@
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from system.kernel.agent import GeminiAgent
+from system.kernel.memory import MemoryManager
+
+
+@pytest.fixture
+def agent(tmp_path: Any) -> Any:
+    agent = GeminiAgent()
+    agent.client = MagicMock()
+    agent._memory = MemoryManager(memory_file=str(tmp_path / "memory.json"))
+    agent._available_tools = {}
+    agent._acall_gemini = AsyncMock(return_value="Insight")  # type: ignore[method-assign]
+    yield agent
+    agent.shutdown()
+
+
+def test_arun_dispatches_tools_through_the_tool_queue(agent: Any) -> None:
+    calls: List[Dict[str, Any]] = []
+
+    def echo(text: str) -> str:
+        calls.append({"text": text})
+        return f"echo: {text}"
+
+    agent._available_tools = {"echo": echo}
+    agent._acall_gemini_stream = AsyncMock(  # type: ignore[method-assign]
+        return_value='{"action": "echo", "args": {"text": "hi"}}'
+    )
+    put = MagicMock(wraps=agent.tool_queue.put)
+    agent.tool_queue.put = put
+
+    asyncio.run(agent.arun("say hi"))
+
+    assert calls == [{"text": "hi"}]
+    put.assert_called_once_with(echo, text="hi")
+    assert any(e.content == "Observation from echo: echo: hi" for e in agent.memory.history)
+
+
+def test_arun_without_tool_reflects_on_the_decision(agent: Any) -> None:
+    agent._acall_gemini_stream = AsyncMock(return_value="The answer is 42.")  # type: ignore[method-assign]
+
+    asyncio.run(agent.arun("what is the answer?"))
+
+    assert agent.state.phase == "IDLE"
+    assert agent.state.observation == "The answer is 42."
+    (prompt,), _ = agent._acall_gemini.call_args
+    assert "Perform a REINFORCEMENT" in prompt
+    assert agent.memory.history[-1].content == "REFLECTION (REINFORCEMENT): Insight"
+
+
+def test_arun_overlaps_synthesis_and_reflection(agent: Any) -> None:
+    agent._available_tools = {"fail": lambda: "Error: disk full"}
+    agent._acall_gemini_stream = AsyncMock(return_value='{"action": "fail", "args": {}}')  # type: ignore[method-assign]
+    in_flight: List[int] = [0]
+    peak: List[int] = [0]
+
+    async def neural(prompt: str) -> str:
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return "final" if prompt.startswith("TASK:") else "lesson"
+
+    agent._acall_gemini = neural  # type: ignore[method-assign]
+    asyncio.run(agent.arun("clean up"))
+
+    assert peak[0] == 2
+    assert agent.state.observation == "final"
+    # REFLECT audits the raw tool outcome, not the synthesized answer
+    assert agent.memory.history[-1].content == "REFLECTION (CRITICAL ANALYSIS): lesson"
+
+
+def test_arun_logs_failures_instead_of_raising(agent: Any) -> None:
+    agent._acall_gemini_stream = AsyncMock(side_effect=RuntimeError("link down"))  # type: ignore[method-assign]
+    asyncio.run(agent.arun("anything"))  # Must not raise
+    assert agent.state.phase == "DECIDE"
+
+
+def test_run_inside_a_running_loop_falls_back_to_sync_phases(agent: Any) -> None:
+    agent._call_gemini_stream = MagicMock(return_value="Done.")  # type: ignore[method-assign]
+    agent._call_gemini = MagicMock(return_value="Sync insight")  # type: ignore[method-assign]
+
+    async def host() -> None:
+        agent.run("inside a host loop")
+
+    asyncio.run(host())
+
+    assert agent.state.phase == "IDLE"
+    assert agent.state.observation == "Done."
+    assert agent.memory.history[-1].content == "REFLECTION (REINFORCEMENT): Sync insight"
+    agent._acall_gemini.assert_not_called()
+
+
+class _Stream:
+    """A chunked response that records how far it was read and whether it was closed."""
+
+    def __init__(self, texts: List[str]) -> None:
+        self.texts = texts
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self) -> Any:
+        for text in self.texts:
+            self.read += 1
+            yield MagicMock(text=text)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _streaming(agent: Any, texts: List[str]) -> _Stream:
+    stream = _Stream(texts)
+    agent.client = MagicMock(spec=["models"])  # No `aio`: the async path offloads the sync one
+    agent.client.models.generate_content_stream.return_value = stream
+    return stream
+
+
+def test_stream_stops_once_a_split_tool_call_is_complete(agent: Any) -> None:
+    stream = _streaming(agent, ['{"action": "ec', 'ho", "args": {"te', 'xt": "hi"}}', " Never read.", " Nor this."])
+
+    text = agent._call_gemini_stream("prompt")
+
+    assert text == '{"action": "echo", "args": {"text": "hi"}}'
+    assert stream.read == 3 and stream.closed
+    assert agent._extract_tool_call(text) == ("echo", {"text": "hi"})
+
+
+def test_stream_keeps_prose_sharing_the_final_chunk(agent: Any) -> None:
+    stream = _streaming(agent, ['Plan: {"action": "echo", ', '"args": {}} then summarize.', " Dropped."])
+
+    text = agent._call_gemini_stream("prompt")
+
+    assert text == 'Plan: {"action": "echo", "args": {}} then summarize.'
+    assert stream.read == 2
+    assert agent._extract_tool_call(text) == ("echo", {})
+
+
+def test_stream_without_tool_call_is_read_to_the_end(agent: Any) -> None:
+    stream = _streaming(agent, ["Just ", "prose {not json}", " to the end."])
+    assert agent._call_gemini_stream("prompt") == "Just prose {not json} to the end."
+    assert stream.read == 3 and stream.closed
+
+
+def test_empty_stream_yields_empty_decision(agent: Any) -> None:
+    _streaming(agent, [])
+    assert agent._call_gemini_stream("prompt") == ""
+    assert asyncio.run(agent._acall_gemini_stream("prompt")) == ""
+    assert agent._extract_tool_call("") == (None, {})
+
+
+def test_async_stream_stops_once_a_split_tool_call_is_complete(agent: Any) -> None:
+    read: List[str] = []
+    closed: List[bool] = []
+
+    class AsyncStream:
+        async def __aiter__(self) -> Any:
+            for text in ['{"action": "echo",', ' "args": {}}', " later"]:
+                read.append(text)
+                yield MagicMock(text=text)
+
+        async def aclose(self) -> None:
+            closed.append(True)
+
+    agent.client = MagicMock()
+    agent.client.aio.models.generate_content_stream = AsyncMock(return_value=AsyncStream())
+
+    assert asyncio.run(agent._acall_gemini_stream("prompt")) == '{"action": "echo", "args": {}}'
+    assert len(read) == 2 and closed == [True]
@@ -0,0 +1,64 @@
+import asyncio
+import json
+import os
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from system.config import MCPServerConfig
+from system.kernel import mcp_client
+from system.kernel.mcp_client import MCPClientManager, MCPServerConnection, MCPTool, MCPToolProxy
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> Any:
+    mcp_client._MANIFEST_CACHE.clear()
+    mcp_client._TOOLS_CACHE.clear()
+    yield
+    mcp_client._MANIFEST_CACHE.clear()
+    mcp_client._TOOLS_CACHE.clear()
+
+
+def test_manifest_cache_keyed_by_mtime(tmp_path: Any) -> None:
+    manifest = tmp_path / "mcp_servers.json"
+    manifest.write_text(json.dumps({"servers": [{"name": "a", "command": "x"}]}))
+
+    manager = MCPClientManager(str(manifest))
+    assert [c.name for c in manager._load_server_configs()] == ["a"]
+
+    cached = next(iter(mcp_client._MANIFEST_CACHE.values()))
+    assert manager._load_server_configs() == cached[1]
+
+    manifest.write_text(json.dumps({"servers": [{"name": "b", "command": "y"}]}))
+    os.utime(manifest, ns=(cached[0] + 1_000_000, cached[0] + 1_000_000))
+    assert [c.name for c in manager._load_server_configs()] == ["b"]
+
+
+def test_discovery_reuses_fresh_tool_list() -> None:
+    tool = MagicMock(description="adds", inputSchema={"type": "object"})
+    tool.name = "add"
+    session = MagicMock()
+    session.list_tools = AsyncMock(return_value=MagicMock(tools=[tool]))
+
+    config = MCPServerConfig(name="calc", command="x")
+    managers = [MCPClientManager("unused.json") for _ in range(2)]
+    for manager in managers:
+        connection = MCPServerConnection(config=config, session=session)
+        asyncio.run(manager._discover_tools(connection))
+        assert [t.prefixed_name for t in connection.tools] == [f"{manager.tool_prefix}calc_add"]
+
+    assert session.list_tools.await_count == 1
+
+
+def test_tool_proxy_is_slotted_and_forwards_calls() -> None:
+    tool = MCPTool(name="add", description="adds", server_name="calc", original_name="add")
+    session = MagicMock()
+    session.call_tool = AsyncMock(return_value=MagicMock(content=[MagicMock(text="3")]))
+    connection = MCPServerConnection(config=MCPServerConfig(name="calc", command="x"), session=session, connected=True)
+
+    proxy = MCPToolProxy(connection, tool, "mcp_calc_add", "adds numbers")
+    assert not hasattr(proxy, "__dict__")
+    assert (proxy.__name__, proxy.__doc__) == ("mcp_calc_add", "adds numbers")
+    assert asyncio.run(proxy(a=1, b=2)) == "3"
+    session.call_tool.assert_awaited_once_with("add", arguments={"a": 1, "b": 2})
@@ -0,0 +1,137 @@
+import pytest
+from typing import Any
+import os
+import json
+import sys
+from pathlib import Path
+
+# Add root to sys.path and discovery
+root_path = Path(__file__).parent.parent
+if str(root_path) not in sys.path:
+    sys.path.insert(0, str(root_path))
+
+from system.config import get_settings
+from system.kernel.memory import MemoryManager, MemoryEntry, MemoryState
+
+@pytest.fixture
+def temp_memory_file(tmp_path: Any) -> Any:
+    return tmp_path / "test_memory.json"
+
+@pytest.fixture
+def memory(temp_memory_file: Any, monkeypatch: Any) -> Any:
+    """In-memory-only MemoryManager for tests that don't assert persistence."""
+    mm = MemoryManager(memory_file=str(temp_memory_file))  # Nothing on disk yet, so no read
+    monkeypatch.setattr(mm, "save_memory", lambda: None)
+    monkeypatch.setattr(mm, "_append_journal", lambda record: None)
+    return mm
+
+def test_memory_entry_creation() -> None:
+    entry = MemoryEntry(role="user", content="hello")
+    assert entry.role == "user"
+    assert entry.content == "hello"
+    assert entry.timestamp is not None
+
+def test_memory_persistence(temp_memory_file: Any) -> None:
+    mm = MemoryManager(memory_file=str(temp_memory_file))
+    mm.add_entry(role="user", content="test message")
+    
+    # Reload memory
+    mm2 = MemoryManager(memory_file=str(temp_memory_file))
+    assert len(mm2.history) == 1
+    assert mm2.history[0].role == "user"
+    assert mm2.history[0].content == "test message"
+
+def test_context_window_summarization(memory: Any) -> None:
+    mm = memory
+    for i in range(15):
+        mm.add_entry(role="user", content=f"message {i}")
+    
+    context = mm.get_context_window(system_prompt="You are a helper", max_messages=10)
+    
+    # context should be: [system, summary_model, recent_10]
+    assert len(context) == 12
+    assert context[0]["role"] == "system"
+    assert context[1]["role"] == "model"
+    assert "PREVIOUS CONTEXT SUMMARY" in context[1]["content"]
+    assert len(context[2:]) == 10
+    assert context[-1]["content"] == "message 14"
+
+def test_clear_memory(memory: Any) -> None:
+    mm = memory
+    mm.add_entry(role="user", content="bye")
+    mm.clear_memory()
+    assert len(mm.history) == 0
+    assert mm.summary == ""
+
+def test_add_entry_journals_until_snapshot(temp_memory_file: Any, monkeypatch: Any) -> None:
+    monkeypatch.setattr(get_settings(), "MEMORY_SNAPSHOT_INTERVAL", 3)
+    journal = temp_memory_file.with_suffix(".jsonl")
+
+    mm = MemoryManager(memory_file=str(temp_memory_file))
+    mm.add_entry(role="user", content="one")
+    mm.add_entry(role="user", content="two")
+    assert not temp_memory_file.exists()
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 2
+
+    mm.add_entry(role="user", content="three")
+    assert not journal.exists()
+    assert len(json.loads(temp_memory_file.read_text(encoding="utf-8"))["history"]) == 3
+
+    mm.add_entry(role="user", content="four")
+    mm2 = MemoryManager(memory_file=str(temp_memory_file))
+    assert [e.content for e in mm2.history] == ["one", "two", "three", "four"]
+
+def test_save_memory_replaces_snapshot_atomically(temp_memory_file: Any) -> None:
+    mm = MemoryManager(memory_file=str(temp_memory_file))
+    mm.add_entry(role="user", content="keep")
+    mm.save_memory()
+
+    assert not temp_memory_file.with_suffix(".tmp").exists()
+    assert json.loads(temp_memory_file.read_text(encoding="utf-8"))["history"][0]["content"] == "keep"
+
+def test_context_window_summarizes_only_spilled_entries(temp_memory_file: Any) -> None:
+    mm = MemoryManager(memory_file=str(temp_memory_file))
+    seen: list = []
+
+    def summarizer(entries: Any, previous: str) -> str:
+        seen.append([e.content for e in entries])
+        return previous + "".join(e.content for e in entries)
+
+    for i in range(5):
+        mm.add_entry(role="user", content=str(i))
+    mm.get_context_window(system_prompt="sys", max_messages=3, summarizer=summarizer)
+    mm.get_context_window(system_prompt="sys", max_messages=3, summarizer=summarizer)
+    mm.add_entry(role="user", content="5")
+    context = mm.get_context_window(system_prompt="sys", max_messages=3, summarizer=summarizer)
+
+    assert seen == [["0", "1"], ["2"]]
+    assert mm.summary == "012"
+    assert [m["content"] for m in context[2:]] == ["3", "4", "5"]
+    assert MemoryManager(memory_file=str(temp_memory_file)).state.summarized == 3
+
+
+def test_summary_updates_are_journaled_not_snapshotted(temp_memory_file: Any) -> None:
+    mm = MemoryManager(memory_file=str(temp_memory_file))
+    for i in range(12):
+        mm.add_entry(role="user", content=f"message {i}")
+    mm.get_context_window(system_prompt="sys", max_messages=10, summarizer=lambda entries, prev: "S1")
+
+    assert not temp_memory_file.exists()  # No full-history rewrite for a summary update
+    reloaded = MemoryManager(memory_file=str(temp_memory_file))
+    assert (reloaded.summary, reloaded.state.summarized, len(reloaded.history)) == ("S1", 2, 12)
+
+
+def test_replay_skips_records_already_in_the_snapshot(temp_memory_file: Any) -> None:
+    mm = MemoryManager(memory_file=str(temp_memory_file))
+    mm.add_entry(role="user", content="one")
+    mm.add_entry(role="user", content="two")
+
+    # Crash between the snapshot swap and the journal unlink: both now hold "one" and "two"
+    journal = temp_memory_file.with_suffix(".jsonl")
+    stale = journal.read_bytes()
+    mm.save_memory()
+    journal.write_bytes(stale)
+    mm.add_entry(role="user", content="three")
+
+    reloaded = MemoryManager(memory_file=str(temp_memory_file))
+    assert [e.content for e in reloaded.history] == ["one", "two", "three"]
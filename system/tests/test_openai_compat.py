@@ -0,0 +1,147 @@
+import json
+import socket
+import sqlite3
+import threading
+from typing import Any, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from system.tools import openai_compat
+
+
+@pytest.fixture
+def mock_post(monkeypatch: Any) -> Generator[MagicMock, None, None]:
+    monkeypatch.setattr(openai_compat.get_settings(), "OPENAI_BASE_URL", "http://llm.local")
+    monkeypatch.setattr(openai_compat.get_settings(), "OPENAI_CACHE_FILE", "")
+    openai_compat._cache.clear()
+    with patch.object(openai_compat._session, "post") as mock:
+        mock.return_value.status_code = 200
+        mock.return_value.content = b'{"choices": [{"message": {"content": "pong"}}]}'
+        yield mock
+    openai_compat._cache.clear()
+
+
+def test_deterministic_replies_are_cached(mock_post: MagicMock) -> None:
+    assert openai_compat.consult_external_llm("ping", temperature=0.0) == "pong"
+    assert openai_compat.consult_external_llm("ping", temperature=0.0) == "pong"
+    assert mock_post.call_count == 1
+    assert mock_post.call_args.args[0] == "http://llm.local/v1/chat/completions"
+
+
+def test_creative_and_failed_replies_are_not_cached(mock_post: MagicMock) -> None:
+    openai_compat.consult_external_llm("ping")
+    openai_compat.consult_external_llm("ping")
+    assert mock_post.call_count == 2
+
+    mock_post.return_value.status_code = 500
+    mock_post.return_value.text = "boom"
+    assert openai_compat.consult_external_llm("other", temperature=0.0).startswith("Error: API returned status 500")
+    mock_post.return_value.status_code = 200
+    assert openai_compat.consult_external_llm("other", temperature=0.0) == "pong"
+
+
+def test_disk_cache_survives_memory_eviction(mock_post: MagicMock, tmp_path: Any, monkeypatch: Any) -> None:
+    monkeypatch.setattr(openai_compat.get_settings(), "OPENAI_CACHE_FILE", str(tmp_path / "llm.db"))
+    openai_compat.consult_external_llm("ping", use_cache=True)
+    openai_compat._cache.clear()
+    assert openai_compat.consult_external_llm("ping", use_cache=True) == "pong"
+    assert mock_post.call_count == 1
+
+
+def test_payload_is_sent_as_json_bytes(mock_post: MagicMock) -> None:
+    openai_compat.consult_external_llm("ping", model="m", temperature=0.0)
+    sent = mock_post.call_args.kwargs
+    assert json.loads(sent["data"])["messages"][1] == {"role": "user", "content": "ping"}
+    assert sent["headers"]["Content-Type"] == "application/json"
+
+    mock_post.return_value.content = b"not json"
+    mock_post.return_value.text = "not json"
+    assert openai_compat.consult_external_llm("bad", temperature=0.0).startswith("Error: Invalid JSON")
+
+
+def test_read_timeout_is_reported_and_not_retried(monkeypatch: Any) -> None:
+    # A server that accepts connections but never answers
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    accepted: List[socket.socket] = []
+
+    def accept() -> None:
+        while True:
+            try:
+                accepted.append(server.accept()[0])
+            except OSError:
+                return
+
+    threading.Thread(target=accept, daemon=True).start()
+    port = server.getsockname()[1]
+    monkeypatch.setattr(openai_compat.get_settings(), "OPENAI_BASE_URL", f"http://127.0.0.1:{port}")
+    monkeypatch.setattr(openai_compat.get_settings(), "OPENAI_CACHE_FILE", "")
+    monkeypatch.setattr(openai_compat, "_TIMEOUT_S", 0.3)
+    try:
+        reply = openai_compat.consult_external_llm("ping", use_cache=False)
+    finally:
+        server.close()
+        for conn in accepted:
+            conn.close()
+
+    assert reply == "Error: External LLM request timed out (0.3s)."
+    assert len(accepted) == 1
+
+
+def test_consult_many_keeps_query_order_and_overlaps(mock_post: MagicMock) -> None:
+    barrier = threading.Barrier(3, timeout=5)
+
+    def reply(endpoint: str, data: bytes, **kwargs: Any) -> MagicMock:
+        barrier.wait()  # Times out unless all three requests are in flight together
+        query = json.loads(data)["messages"][1]["content"]
+        response = MagicMock(status_code=200)
+        response.content = json.dumps({"choices": [{"message": {"content": query.upper()}}]}).encode()
+        return response
+
+    mock_post.side_effect = reply
+    assert openai_compat.consult_external_llm_many(["a", "b", "c"]) == ["A", "B", "C"]
+
+
+def test_consult_many_works_inside_a_running_loop(mock_post: MagicMock) -> None:
+    import asyncio
+
+    async def host() -> List[str]:
+        return openai_compat.consult_external_llm_many(["x", "y"], temperature=0.0)
+
+    assert asyncio.run(host()) == ["pong", "pong"]
+    assert mock_post.call_count == 2
+
+
+def test_disk_cache_creates_schema_once_and_always_closes(
+    mock_post: MagicMock, tmp_path: Any, monkeypatch: Any
+) -> None:
+    statements: List[str] = []
+    closed: List[bool] = []
+    fail = [False]
+    real_connect = sqlite3.connect
+
+    class TracedConnection(sqlite3.Connection):
+        def execute(self, sql: str, *args: Any) -> Any:  # type: ignore[override]
+            statements.append(sql.split()[0])
+            if fail[0]:
+                raise sqlite3.OperationalError("disk I/O error")
+            return super().execute(sql, *args)
+
+        def close(self) -> None:
+            closed.append(True)
+            super().close()
+
+    monkeypatch.setattr(openai_compat.get_settings(), "OPENAI_CACHE_FILE", str(tmp_path / "llm.db"))
+    monkeypatch.setattr(openai_compat.sqlite3, "connect", lambda *a, **kw: real_connect(*a, factory=TracedConnection, **kw))
+
+    openai_compat.consult_external_llm("one", use_cache=True)
+    openai_compat.consult_external_llm("two", use_cache=True)
+    assert statements.count("CREATE") == 1
+
+    fail[0] = True
+    opened = len(closed)
+    openai_compat._cache.clear()
+    assert openai_compat.consult_external_llm("three", use_cache=True) == "pong"  # Cache errors are swallowed
+    assert len(closed) == opened + 2  # The failed SELECT and INSERT connections were both closed
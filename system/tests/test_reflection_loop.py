@@ -2,15 +2,26 @@ from typing import Any
 import pytest
 from unittest.mock import MagicMock
 from system.kernel.agent import GeminiAgent, AgentState
+from system.kernel.memory import MemoryManager
 
-@pytest.fixture
-def agent() -> Any:
+@pytest.fixture(scope="module")
+def agent(tmp_path_factory: Any) -> Any:
+    # Boot the kernel once for the whole module; `_reset_agent` isolates each test
     agent = GeminiAgent()
     # Mock the client to avoid actual API calls
     agent.client = MagicMock()
     # Mock _call_gemini to return predictable responses
     agent._call_gemini = MagicMock(return_value="Reflection Insight") # type: ignore
-    return agent
+    # Keep reflections out of the real artifacts memory
+    agent._memory = MemoryManager(memory_file=str(tmp_path_factory.mktemp("reflection") / "memory.json"))
+    yield agent
+    agent.shutdown()
+
+@pytest.fixture(autouse=True)
+def _reset_agent(agent: Any) -> None:
+    agent.memory.clear_memory()
+    agent.state = AgentState()
+    agent._call_gemini.reset_mock()
 
 def test_reflection_failure(agent: Any) -> None:
     """Test that failure triggers CRITICAL ANALYSIS."""
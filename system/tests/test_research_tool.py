@@ -0,0 +1,45 @@
+import time
+from typing import Any, Dict, List
+
+from system.kernel.tool_queue import run_tools
+from system.tools import research_tool, sandbox_tool
+
+
+def test_progress_goes_to_the_event_sink(monkeypatch: Any) -> None:
+    events: List[Dict[str, Any]] = []
+    monkeypatch.setattr(research_tool, "_sink", events.append)
+
+    result = research_tool.perform_deep_research("caching", depth=2)
+    assert research_tool._flush()
+
+    assert result["sources_analyzed"] == 10
+    assert len(result["process_log"]) == 2
+    assert [e["step"] for e in events] == [0, 1, 2, 3]
+    assert all(e["tool"] == "research" for e in events)
+    assert events[0]["msg"] == "🕵️ [RESEARCH] Deep dive on: caching (Depth: 2)"
+
+
+def test_failing_sink_does_not_stop_the_drain(monkeypatch: Any) -> None:
+    def broken(event: Dict[str, Any]) -> None:
+        raise RuntimeError("sink down")
+
+    monkeypatch.setattr(research_tool, "_sink", broken)
+    research_tool.perform_deep_research("x")
+    assert research_tool._flush()
+
+
+def test_progress_stays_out_of_sandbox_output(monkeypatch: Any) -> None:
+    def slow_print(event: Dict[str, Any]) -> None:
+        time.sleep(0.05)  # Keep the drain printing while the sandbox has stdout redirected
+        research_tool._print_event(event)
+
+    monkeypatch.setattr(research_tool, "_sink", slow_print)
+    snippet = "total = sum(range(5_000_000))\nprint('inside')"
+    results = run_tools([
+        (research_tool.perform_deep_research, ("caching",), {}),
+        (sandbox_tool.execute_python_code, (snippet,), {}),
+    ])
+    assert research_tool._flush()
+
+    assert results[0]["topic"] == "caching"
+    assert results[1]["output"] == "inside\n"
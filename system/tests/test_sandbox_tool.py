@@ -0,0 +1,92 @@
+import pytest
+
+from system.tools import sandbox_tool
+
+
+@pytest.mark.parametrize("code, bad", [
+    ("import  os", "import os"),
+    ("import subprocess as sp", "import subprocess"),
+    ("from os.path import join", "from os.path import"),
+    ("__import__('os')", "__import__("),
+    ("f = open ('x')", "open("),
+    ("().__class__.__bases__", "__bases__"),
+    ("__builtins__['__imp'+'ort__']('os').getcwd()", "__builtins__"),
+    ("__builtins__.get('op'+'en')('/etc/hostname')", "__builtins__"),
+    ("import importlib; importlib.import_module('o'+'s')", "import importlib"),
+    ("import builtins", "import builtins"),
+    ("import gzip; gzip.open('x')", "import gzip"),
+    ("import posix\nposix.system('id')", "import posix"),
+    ("import pickle; pickle.loads(b'')", "import pickle"),
+    ("from marshal import loads", "from marshal import"),
+    ("from . import helper", "from . import"),
+    ("import json; json.loads.__globals__", "__globals__"),
+    ("g = (i for i in [1]); g.gi_frame.f_back", "f_back"),
+])
+def test_rejects_forbidden_constructs(code: str, bad: str) -> None:
+    assert sandbox_tool.execute_python_code(code) == {
+        "status": "error", "error": f"Security Violation: '{bad}' is forbidden."
+    }
+
+
+def test_allows_lookalike_text() -> None:
+    # The old substring scan rejected these: the words only appear inside a string
+    result = sandbox_tool.execute_python_code("print('import os; remember to open(')")
+    assert result["status"] == "success"
+    assert result["output"] == "import os; remember to open(\n"
+
+
+def test_allows_plain_computation() -> None:
+    code = "import math\nitems = [3, 1, 2]\nitems.remove(1)\nprint(sorted(items), math.sqrt(16))"
+    assert sandbox_tool.execute_python_code(code)["output"] == "[2, 3] 4.0\n"
+
+
+def test_allows_classes_with_super_and_private_attributes() -> None:
+    code = (
+        "class Base:\n"
+        "    def __init__(self, label):\n"
+        "        self._label = label\n"
+        "class Child(Base):\n"
+        "    def __init__(self):\n"
+        "        super().__init__('m')\n"
+        "    @property\n"
+        "    def label(self):\n"
+        "        return self._label\n"
+        "child = Child()\n"
+        "print(child.label, hasattr(child, '_label'), type(1), isinstance(child, object))"
+    )
+    result = sandbox_tool.execute_python_code(code)
+    assert result["status"] == "success"
+    assert result["output"] == "m True <class 'int'> True\n"
+
+
+def test_allowed_modules_hide_reexported_modules() -> None:
+    code = "import collections.abc\nfrom json import decoder\nprint(collections.abc.Mapping.__name__, decoder.JSONDecoder.__name__)"
+    assert sandbox_tool.execute_python_code(code)["output"] == "Mapping JSONDecoder\n"
+    for code in ("import datetime; datetime.sys", "import random; random._os", "import json; json.codecs"):
+        assert "has no attribute" in sandbox_tool.execute_python_code(code)["error"]
+    assert sandbox_tool.execute_python_code("from string import Formatter")["status"] == "error"
+    assert sandbox_tool.execute_python_code("import math; math.pi = 3")["error"].startswith("cannot set 'pi'")
+
+
+def test_builtins_are_whitelisted() -> None:
+    # Whatever slips past the static check still runs without open/getattr/eval
+    result = sandbox_tool.execute_python_code("getattr(print, 'x')")
+    assert result == {"status": "error", "error": "name 'getattr' is not defined"}
+    for name in ("os", "posix", "pickle", "marshal"):
+        with pytest.raises(ImportError):
+            sandbox_tool._guarded_import(name)
+
+
+def test_reports_syntax_errors() -> None:
+    result = sandbox_tool.execute_python_code("def f(:")
+    assert result["status"] == "error"
+    assert "invalid syntax" in result["error"]
+
+
+def test_repeat_snippets_reuse_compiled_code_without_sharing_state() -> None:
+    sandbox_tool._prepare.cache_clear()
+    code = "try:\n    counter += 1\nexcept NameError:\n    counter = 1\nprint(counter)"
+
+    assert sandbox_tool.execute_python_code(code)["output"] == "1\n"
+    assert sandbox_tool.execute_python_code(code)["output"] == "1\n"
+    assert sandbox_tool._prepare.cache_info().hits == 1
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from typing import Any, List
+
+import pytest
+
+from system.kernel.tool_queue import ToolQueue, run_tools
+from system.tools import sandbox_tool
+
+
+def _boom() -> None:
+    raise ValueError("boom")
+
+
+def test_batch_runs_concurrently_in_order() -> None:
+    def slow(value: int) -> int:
+        time.sleep(0.2)
+        return value
+
+    start = time.perf_counter()
+    results = run_tools([(slow, (i,), {}) for i in range(4)] + [(_boom, (), {})])
+    elapsed = time.perf_counter() - start
+
+    assert results[:4] == [0, 1, 2, 3]
+    assert isinstance(results[4], ValueError)
+    assert elapsed < 0.6  # Serial would take 0.8 s
+
+
+def test_exclusive_tools_never_overlap() -> None:
+    active: List[int] = []
+    peak: List[int] = [0]
+    lock = threading.Lock()
+
+    def execute_python_code(code: str) -> str:
+        with lock:
+            active.append(1)
+            peak[0] = max(peak[0], len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+        return code
+
+    assert run_tools([(execute_python_code, (str(i),), {}) for i in range(4)]) == ["0", "1", "2", "3"]
+    assert peak[0] == 1
+
+
+def test_exclusive_tools_run_after_the_rest_of_the_batch() -> None:
+    def noisy(i: int) -> int:
+        for _ in range(20):
+            print(f"noisy tool line {i}")
+            time.sleep(0.005)
+        return i
+
+    # Slow enough that the noisy tools would still be printing if they overlapped it
+    snippet = "total = sum(range(5_000_000))\nprint('inside')"
+    calls: List[Any] = [(noisy, (i,), {}) for i in range(3)]
+    calls.append((sandbox_tool.execute_python_code, (snippet,), {}))
+    results = run_tools(calls)
+
+    assert results[:3] == [0, 1, 2]
+    assert results[3]["output"] == "inside\n"
+
+
+def test_put_respects_max_batch() -> None:
+    batches: List[int] = []
+
+    async def main() -> List[Any]:
+        queue = ToolQueue(max_batch=2, window_ms=5)
+        original = queue._dispatch
+
+        async def spy(batch: Any) -> None:
+            batches.append(len(batch))
+            await original(batch)
+
+        queue._dispatch = spy  # type: ignore[method-assign]
+        try:
+            futures = [queue.put(lambda v=v: v) for v in range(5)]
+            return list(await asyncio.gather(*futures))
+        finally:
+            await queue.close()
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
+    assert batches == [2, 2, 1]
+
+
+@pytest.mark.parametrize("window_ms", [5, 10_000])
+def test_close_cancels_requests_already_taken_off_the_queue(window_ms: float) -> None:
+    # window_ms=5: closed mid-dispatch; window_ms=10_000: closed while the batch is filling
+    async def main() -> "asyncio.Future[Any]":
+        queue = ToolQueue(window_ms=window_ms)
+        future = queue.put(time.sleep, 0.3)
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(queue.close(), 1)
+        return future
+
+    future = asyncio.run(main())
+    assert future.cancelled()
+
+
+def test_run_tools_falls_back_inside_running_loop() -> None:
+    async def main() -> List[Any]:
+        return run_tools([(len, ("abc",), {}), (_boom, (), {})])
+
+    results = asyncio.run(main())
+    assert results[0] == 3
+    with pytest.raises(ValueError):
+        raise results[1]
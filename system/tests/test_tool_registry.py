@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+# Add root to sys.path
+root_path = Path(__file__).parent.parent.parent
+if str(root_path) not in sys.path:
+    sys.path.insert(0, str(root_path))
+
+from scripts.gen_tool_registry import scan_tools
+from system.tools._registry import TOOLS, TOOL_DOCS
+from system.kernel.agent import LazyTool
+
+
+def test_registry_in_sync() -> None:
+    """The committed registry must match a fresh scan of system/tools/."""
+    tools, docs = scan_tools()
+    assert TOOLS == tools, "Tool registry is stale: run scripts/gen_tool_registry.py"
+    assert TOOL_DOCS == docs, "Tool registry is stale: run scripts/gen_tool_registry.py"
+
+
+def test_lazy_tool_resolves_on_call() -> None:
+    module, attr = TOOLS["check_technical_mastery"]
+    tool = LazyTool("check_technical_mastery", module, attr, TOOL_DOCS["check_technical_mastery"])
+    assert tool._fn is None
+    result = tool("Nguyen Van A", "Morita")
+    assert result["is_qualified"] is True
+    assert tool._fn is not None
@@ -0,0 +1,44 @@
+"""
+AUTO-GENERATED by scripts/gen_tool_registry.py. Do not edit by hand.
+
+Maps each public tool name to its (module, attribute) location and docstring.
+"""
+from typing import Dict, Tuple
+
+TOOLS: Dict[str, Tuple[str, str]] = {
+    'autonomous_coding_session': ('system.tools.dev_skills', 'autonomous_coding_session'),
+    'check_technical_mastery': ('system.tools.dev_skills', 'check_technical_mastery'),
+    'check_technical_mastery_bulk': ('system.tools.dev_skills', 'check_technical_mastery_bulk'),
+    'consult_external_llm': ('system.tools.openai_compat', 'consult_external_llm'),
+    'consult_external_llm_many': ('system.tools.openai_compat', 'consult_external_llm_many'),
+    'execute_python_code': ('system.tools.sandbox_tool', 'execute_python_code'),
+    'git_add': ('system.tools.git_tool', 'git_add'),
+    'git_commit': ('system.tools.git_tool', 'git_commit'),
+    'git_diff': ('system.tools.git_tool', 'git_diff'),
+    'git_log': ('system.tools.git_tool', 'git_log'),
+    'git_status': ('system.tools.git_tool', 'git_status'),
+    'list_files': ('system.tools.filesystem_tool', 'list_files'),
+    'perform_deep_research': ('system.tools.research_tool', 'perform_deep_research'),
+    'read_file': ('system.tools.filesystem_tool', 'read_file'),
+    'search_pattern': ('system.tools.filesystem_tool', 'search_pattern'),
+    'search_patterns': ('system.tools.filesystem_tool', 'search_patterns'),
+}
+
+TOOL_DOCS: Dict[str, str] = {
+    'autonomous_coding_session': "\n    Runs an autonomous development loop to plan, implement, and verify code features.\n    Adapted from AutonomousCodingSkill.\n    \n    Args:\n        objective: The development goal (e.g., 'Implement user login')\n        max_iterations: Safety limit for autonomous steps\n    \n    Returns:\n        Dict containing the session history and status.\n    ",
+    'check_technical_mastery': "\n    Checks if a technician is qualified to work on a specific brand.\n    Adapted from TechnicalMasterySkill.\n    \n    Args:\n        technician_name: Name of the technician\n        brand: The brand being serviced (e.g., 'Morita', 'Mectron')\n        required_level: Minimum certification level required (default 3)\n    ",
+    'check_technical_mastery_bulk': "\n    Checks many technician/brand pairs in one call.\n    \n    Args:\n        technician_names: Names of the technicians\n        brands: The brand for each technician, paired by position\n        required_level: Minimum certification level required (default 3)\n    \n    Returns:\n        One result per pair, shaped like check_technical_mastery's.\n    ",
+    'consult_external_llm': "\n    Consults an external OpenAI-compatible LLM for a second opinion or specialized task.\n\n    Use this tool when:\n    1. You need a different perspective (e.g., asking GPT-4 to review Gemini's code).\n    2. You need to access a local model via Ollama (set OPENAI_BASE_URL to localhost).\n\n    Args:\n        query: The main question or task description.\n        system_instruction: The persona or constraints for the external model.\n        model: (Optional) Specific model identifier. Defaults to config settings.\n        temperature: Creativity setting (0.0 = deterministic, 1.0 = creative).\n        use_cache: (Optional) Reuse a previous identical reply. Defaults to on only\n            for near-deterministic calls (temperature <= 0.2).\n\n    Returns:\n        String containing the external model's response.\n    ",
+    'consult_external_llm_many': '\n    Consults an external OpenAI-compatible LLM with several independent queries at once.\n\n    Use this tool instead of repeated consult_external_llm calls when the questions do not\n    depend on each other: requests are in flight concurrently, so the wait is roughly the\n    slowest answer rather than the sum of all of them.\n\n    Args:\n        queries: The questions or task descriptions, one request each.\n        system_instruction: The persona or constraints shared by every request.\n        model: (Optional) Specific model identifier. Defaults to config settings.\n        temperature: Creativity setting (0.0 = deterministic, 1.0 = creative).\n        use_cache: (Optional) Reuse previous identical replies; see consult_external_llm.\n\n    Returns:\n        One response (or "Error: ..." string) per query, in query order.\n    ',
+    'execute_python_code': '\n    Executes Python code in a controlled ephemeral environment for calculation and logic.\n    Adapted from CodeSandboxSkill.\n    \n    Args:\n        code: The python code to execute.\n    ',
+    'git_add': '\n    Stages a specific file.\n    \n    Args:\n        filename: The file path to stage.\n    ',
+    'git_commit': '\n    Commits changes to the repository.\n    \n    Args:\n        message: The commit message.\n        add_all: If True, stages all modified files before committing (-a).\n    ',
+    'git_diff': '\n    Shows changes in the working directory or staging area.\n    \n    Args:\n        filename: Optional specific file to diff.\n        staged: If True, shows changes that are staged for commit (--cached).\n    ',
+    'git_log': '\n    Shows the most recent commits.\n    \n    Args:\n        n: Number of commits to show.\n    ',
+    'git_status': '\n    Returns the status of the repository.\n    Equivalent to: git status\n    ',
+    'list_files': '\n    Lists files and directories in a given path.\n\n    Args:\n        directory: The root directory to scan.\n        recursive: If True, scan subdirectories.\n        extensions: Filter by file extensions (e.g., [".py", ".md"]).\n        max_depth: Maximum recursion depth.\n\n    Returns:\n        List of file metadata dictionaries.\n    ',
+    'perform_deep_research': '\n    Performs iterative, multi-source research to answer complex strategic questions.\n    Adapted from DeepResearchSkill.\n    \n    Args:\n        topic: The research subject.\n        depth: Depth of recursion (simulated).\n    ',
+    'read_file': '\n    Reads the content of a text file.\n\n    Args:\n        file_path: Absolute path to the file.\n        max_lines: Maximum number of lines to return.\n\n    Returns:\n        File contents as a string, or an error message.\n    ',
+    'search_pattern': '\n    Searches for a text pattern in files within a directory.\n    `.git`, `node_modules` and `__pycache__` directories are skipped.\n\n    Args:\n        directory: The root directory to search.\n        pattern: The text pattern to search for.\n        extensions: Filter by file extensions.\n        max_results: Maximum number of matching lines to return.\n\n    Returns:\n        List of match results with file path, line number, and content.\n    ',
+    'search_patterns': '\n    Searches for several text patterns at once, reading each file a single time.\n\n    Args:\n        directory: The root directory to search.\n        patterns: The literal text patterns to search for.\n        extensions: Filter by file extensions.\n        max_results: Maximum number of matches to return.\n\n    Returns:\n        List of match results with file path, line number, matched pattern, and content.\n    ',
+}
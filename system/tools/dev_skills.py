@@ -1,4 +1,19 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+# Simulated session state machine: state -> (action, details template, next state).
+# A next state of None ends the session.
+_INITIAL_STATE = "planning"
+_TRANSITIONS: Dict[str, Tuple[str, str, Optional[str]]] = {
+    "planning": ("plan", "Decomposed objective: {objective}", "implementing"),
+    "implementing": ("implement", "Generated code for {objective}", "verifying"),
+    "verifying": ("verify", "Tests passed.", None),
+}
+
+# Mock database of tech skills (mirroring the source skill), built once at import
+_TECH_DB: Dict[str, Dict[str, int]] = {
+    "Nguyen Van A": {"Morita": 5, "Mectron": 3, "Planmeca": 2},
+    "Tran Van B": {"Morita": 2, "Mectron": 4, "Planmeca": 1}
+}
 
 def autonomous_coding_session(objective: str, max_iterations: int = 5) -> Dict[str, Any]:
     """
@@ -15,29 +30,14 @@ def autonomous_coding_session(objective: str, max_iterations: int = 5) -> Dict[s
     print(f"🤖 [AUTO-CODE] Starting session for: {objective}")
     
     iterations = 0
-    current_status = "planning"
+    state = _INITIAL_STATE
     results = []
 
-    while iterations < max_iterations:
+    while state and iterations < max_iterations:
         iterations += 1
-        
-        if current_status == "planning":
-            # Simulated planning step
-            action = "plan"
-            details = f"Decomposed objective: {objective}"
-            current_status = "implementing"
-        elif current_status == "implementing":
-            # Simulated implementation step
-            action = "implement"
-            details = f"Generated code for {objective}"
-            current_status = "verifying"
-        elif current_status == "verifying":
-            # Simulated verification step
-            action = "verify"
-            details = "Tests passed."
-            results.append({"step": iterations, "action": action, "details": details})
-            break
-            
+        action, template, state = _TRANSITIONS[state]
+        details = template.format(objective=objective)
+
         results.append({"step": iterations, "action": action, "details": details})
         print(f"   Step {iterations}: {action.upper()} - {details}")
 
@@ -58,17 +58,15 @@ def check_technical_mastery(technician_name: str, brand: str, required_level: in
         brand: The brand being serviced (e.g., 'Morita', 'Mectron')
         required_level: Minimum certification level required (default 3)
     """
-    # Mock database of tech skills (mirroring the source skill)
-    tech_db = {
-        "Nguyen Van A": {"Morita": 5, "Mectron": 3, "Planmeca": 2},
-        "Tran Van B": {"Morita": 2, "Mectron": 4, "Planmeca": 1}
-    }
+    current_level = _TECH_DB.get(technician_name, {}).get(brand, 0)
+    result = _mastery_result(technician_name, brand, current_level, required_level)
     
-    tech_stats = tech_db.get(technician_name, {})
-    current_level = tech_stats.get(brand, 0)
+    print(f"🛡️ [MASTERY] {result['message']} ({technician_name} -> {brand}: {current_level})")
+    return result
+
+def _mastery_result(technician_name: str, brand: str, current_level: int, required_level: int) -> Dict[str, Any]:
     is_qualified = current_level >= required_level
-    
-    result = {
+    return {
         "status": "success",
         "technician": technician_name,
         "brand": brand,
@@ -76,6 +74,29 @@ def check_technical_mastery(technician_name: str, brand: str, required_level: in
         "is_qualified": is_qualified,
         "message": "AUTHORIZED" if is_qualified else f"UNAUTHORIZED: Rank {required_level} required for specialized {brand} repair."
     }
+
+def check_technical_mastery_bulk(
+    technician_names: List[str], brands: List[str], required_level: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Checks many technician/brand pairs in one call.
     
-    print(f"🛡️ [MASTERY] {result['message']} ({technician_name} -> {brand}: {current_level})")
-    return result
+    Args:
+        technician_names: Names of the technicians
+        brands: The brand for each technician, paired by position
+        required_level: Minimum certification level required (default 3)
+    
+    Returns:
+        One result per pair, shaped like check_technical_mastery's.
+    """
+    if len(technician_names) != len(brands):
+        return [{"status": "error", "message": "technician_names and brands must have the same length."}]
+
+    results = [
+        _mastery_result(name, brand, _TECH_DB.get(name, {}).get(brand, 0), required_level)
+        for name, brand in zip(technician_names, brands)
+    ]
+
+    authorized = sum(1 for r in results if r["is_qualified"])
+    print(f"🛡️ [MASTERY] {authorized}/{len(results)} pairs AUTHORIZED")
+    return results
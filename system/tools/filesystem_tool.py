@@ -6,17 +6,30 @@ Purpose: Provides file system operations for the Agent.
 Capabilities:
 - List directory contents recursively.
 - Read file contents.
-- Search for patterns in files.
+- Search for patterns in files (one or many per pass).
 """
 
+import mmap
 import os
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, Deque, FrozenSet, Iterator, List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
 
+# search_pattern skips files larger than this (logs, dumps, binaries)
+_MAX_SEARCH_BYTES = 32 * 1024 * 1024
+# Threads for the per-file search fan-out; the scans are I/O-bound
+_SEARCH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Directories the search walk never descends into (VCS internals, vendored deps, bytecode)
+_PRUNE = frozenset({".git", "node_modules", "__pycache__"})
+
+
 class FileInfo(BaseModel):
-    """Schema for file metadata."""
+    """Schema for file metadata (the shape of each `list_files` entry)."""
     path: str
     name: str
     is_dir: bool
@@ -24,6 +37,14 @@ class FileInfo(BaseModel):
     extension: str = ""
 
 
+def _extension_set(extensions: Optional[List[str]]) -> FrozenSet[str]:
+    """
+    Normalizes an `extensions` filter for matching against `os.path.splitext(name)[1]`
+    (Path.suffix semantics): "py" means ".py", and a bare dotfile like ".py" has no extension.
+    """
+    return frozenset(e if e.startswith(".") else f".{e}" for e in extensions or ())
+
+
 def list_files(
     directory: str,
     recursive: bool = False,
@@ -47,34 +68,49 @@ def list_files(
         return [{"error": f"Directory not found: {directory}"}]
 
     results: List[Dict[str, Any]] = []
+    ext_set = _extension_set(extensions)
 
-    def _scan(current: Path, depth: int) -> None:
-        if depth > max_depth:
-            return
-
+    def _entries(current: str) -> List[os.DirEntry]:
+        # Drain the scandir iterator up front so its fd is closed before descending
         try:
-            for item in current.iterdir():
-                info = FileInfo(
-                    path=str(item),
-                    name=item.name,
-                    is_dir=item.is_dir(),
-                    size_bytes=item.stat().st_size if item.is_file() else 0,
-                    extension=item.suffix if item.is_file() else ""
-                )
+            with os.scandir(current) as it:
+                return list(it)
+        except PermissionError:
+            results.append({"error": f"Permission denied: {current}"})
+            return []
 
-                if extensions and item.is_file():
-                    if info.extension not in extensions:
-                        continue
+    # scandir('.') yields './name'; Path('.') / name renders as 'name', so trim to match
+    trim = 2 if str(root) == "." else 0
 
-                results.append(info.model_dump())
+    # Explicit DFS stack of (pending entries, depth); keeps pre-order output without recursion
+    stack = [(iter(_entries(str(root))), 0)]
+    while stack:
+        pending, depth = stack[-1]
+        entry = next(pending, None)
+        if entry is None:
+            stack.pop()
+            continue
 
-                if recursive and item.is_dir():
-                    _scan(item, depth + 1)
+        # DirEntry caches the type bits from the directory read; stat() is taken once, files only
+        is_file = entry.is_file()
+        is_dir = entry.is_dir()
+        extension = os.path.splitext(entry.name)[1] if is_file else ""
 
-        except PermissionError:
-            results.append({"error": f"Permission denied: {current}"})
+        if ext_set and is_file and extension not in ext_set:
+            continue
+
+        # Plain dict in FileInfo's shape: validating then dumping a model per entry is pure overhead
+        results.append({
+            "path": entry.path[trim:],
+            "name": entry.name,
+            "is_dir": is_dir,
+            "size_bytes": entry.stat().st_size if is_file else 0,
+            "extension": extension,
+        })
+
+        if recursive and is_dir and depth < max_depth:
+            stack.append((iter(_entries(entry.path)), depth + 1))
 
-    _scan(root, 0)
     return results
 
 
@@ -96,15 +132,186 @@ def read_file(file_path: str, max_lines: int = 500) -> str:
         return f"Error: Path is not a file: {file_path}"
 
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-        if len(lines) > max_lines:
-            truncated = lines[:max_lines]
-            return "\n".join(truncated) + f"\n\n... [Truncated: {len(lines) - max_lines} more lines]"
-        return "\n".join(lines)
+        # Stream: only the first `max_lines` lines are ever held in memory
+        with path.open("r", encoding="utf-8") as fh:
+            head = [line.rstrip("\n") for line in islice(fh, max_lines)]
+            remaining = sum(1 for _ in fh)
+        if remaining:
+            return "\n".join(head) + f"\n\n... [Truncated: {remaining} more lines]"
+        return "\n".join(head)
     except Exception as e:
         return f"Error reading file: {e}"
 
 
+def _iter_files(root: Path, extensions: Optional[List[str]]) -> Iterator[str]:
+    """
+    Yields file paths under `root` in the same order and shape as `root.rglob("*")`,
+    applying the extension filter during the walk. Symlinked directories and `_PRUNE`
+    directories are not entered.
+    """
+    # scandir('.') yields './name'; Path('.') / name renders as 'name', so trim to match
+    trim = 2 if str(root) == "." else 0
+    ext_set = _extension_set(extensions)
+    pending = [str(root)]
+
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs: List[str] = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _PRUNE:
+                        subdirs.append(entry.path)
+                elif ext_set and os.path.splitext(entry.name)[1] not in ext_set:
+                    continue  # Filter on the name before paying for is_file()
+                elif entry.is_file():
+                    yield entry.path[trim:]
+            except OSError:
+                continue
+        pending.extend(reversed(subdirs))
+
+
+def _parallel_search(
+    root: Path,
+    extensions: Optional[List[str]],
+    max_results: int,
+    scan: Callable[[str], List[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """
+    Runs `scan` over every candidate file on a thread pool (mmap reads and finds release
+    the GIL). Futures are consumed in walk order through a bounded window, so results
+    match a serial scan and the walk stops as soon as `max_results` is reached.
+    """
+    results: List[Dict[str, Any]] = []
+    files = _iter_files(root, extensions)
+    window: Deque["Future[List[Dict[str, Any]]]"] = deque()
+
+    executor = ThreadPoolExecutor(max_workers=_SEARCH_WORKERS, thread_name_prefix="fs-search")
+    try:
+        for file_path in files:
+            window.append(executor.submit(scan, file_path))
+            if len(window) < _SEARCH_WORKERS * 2:
+                continue
+            results.extend(_drain(window.popleft()))
+            if len(results) >= max_results:
+                break
+
+        while window and len(results) < max_results:
+            results.extend(_drain(window.popleft()))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return results[:max_results]
+
+
+def _drain(future: "Future[List[Dict[str, Any]]]") -> List[Dict[str, Any]]:
+    """Result of one file scan; unreadable files contribute nothing."""
+    try:
+        return future.result()
+    except Exception:
+        return []
+
+
+def _scan_file(file_path: str, needle: bytes, limit: int) -> List[Dict[str, Any]]:
+    """
+    Finds up to `limit` lines of one file containing `needle`.
+    Works on raw bytes over an mmap: files without a match are rejected by a single
+    C-level find and never decoded; only matching lines are.
+    """
+    matches: List[Dict[str, Any]] = []
+
+    with open(file_path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0 or size > _MAX_SEARCH_BYTES:
+            return matches
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(needle)
+            line_number = 1
+            counted_to = 0
+
+            while 0 <= pos < size:
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                line_end = mm.find(b"\n", pos)
+                if line_end < 0:
+                    line_end = size
+
+                if pos + len(needle) <= line_end:
+                    # Running newline count: each byte is scanned once across all matches
+                    line_number += mm[counted_to:line_start].count(b"\n")
+                    counted_to = line_start
+                    line = mm[line_start:line_end].decode("utf-8", errors="ignore")
+                    matches.append({
+                        "file": file_path,
+                        "line_number": line_number,
+                        "content": line.strip()[:200]
+                    })
+                    if len(matches) >= limit:
+                        break
+
+                # One hit per line: resume the search on the next line
+                pos = mm.find(needle, line_end + 1)
+
+    return matches
+
+
+def _scan_file_multi(
+    file_path: str, rx: "re.Pattern[bytes]", needles: List[bytes], limit: int
+) -> List[Dict[str, Any]]:
+    """
+    Like `_scan_file`, but for several needles: one pass of the compiled alternation `rx`
+    finds candidate lines, then every needle is checked against each such line, so
+    overlapping or nested patterns ("foo" and "bar" in "foobar") are all reported.
+    Yields the same (line, pattern) pairs as one `_scan_file` per needle, ordered by
+    line, then by first position within the line, then by `needles` order.
+    """
+    matches: List[Dict[str, Any]] = []
+
+    with open(file_path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0 or size > _MAX_SEARCH_BYTES:
+            return matches
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            line_number = 1
+            counted_to = 0
+            m = rx.search(mm)
+
+            while m is not None:
+                pos = m.start()
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                line_end = mm.find(b"\n", pos)
+                if line_end < 0:
+                    line_end = size
+
+                line_number += mm[counted_to:line_start].count(b"\n")
+                counted_to = line_start
+                raw = mm[line_start:line_end]
+                hits = sorted((at, i) for i, at in enumerate(raw.find(n) for n in needles) if at >= 0)
+
+                line = raw.decode("utf-8", errors="ignore").strip()[:200]
+                for _, i in hits:
+                    matches.append({
+                        "file": file_path,
+                        "line_number": line_number,
+                        "pattern": needles[i].decode("utf-8", errors="ignore"),
+                        "content": line
+                    })
+                    if len(matches) >= limit:
+                        return matches
+
+                # Every needle of this line is reported: resume on the next line
+                m = rx.search(mm, line_end + 1)
+
+    return matches
+
+
 def search_pattern(
     directory: str,
     pattern: str,
@@ -113,6 +320,7 @@ def search_pattern(
 ) -> List[Dict[str, Any]]:
     """
     Searches for a text pattern in files within a directory.
+    `.git`, `node_modules` and `__pycache__` directories are skipped.
 
     Args:
         directory: The root directory to search.
@@ -127,30 +335,36 @@ def search_pattern(
     if not root.exists():
         return [{"error": f"Directory not found: {directory}"}]
 
-    results: List[Dict[str, Any]] = []
+    needle = pattern.encode("utf-8")
+    return _parallel_search(root, extensions, max_results, lambda fp: _scan_file(fp, needle, max_results))
 
-    for file_path in root.rglob("*"):
-        if len(results) >= max_results:
-            break
 
-        if not file_path.is_file():
-            continue
+def search_patterns(
+    directory: str,
+    patterns: List[str],
+    extensions: Optional[List[str]] = None,
+    max_results: int = 50
+) -> List[Dict[str, Any]]:
+    """
+    Searches for several text patterns at once, reading each file a single time.
 
-        if extensions and file_path.suffix not in extensions:
-            continue
+    Args:
+        directory: The root directory to search.
+        patterns: The literal text patterns to search for.
+        extensions: Filter by file extensions.
+        max_results: Maximum number of matches to return.
 
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            for i, line in enumerate(content.splitlines(), 1):
-                if pattern in line:
-                    results.append({
-                        "file": str(file_path),
-                        "line_number": int(i),
-                        "content": str(line.strip()[:200])
-                    })
-                    if len(results) >= max_results:
-                        break
-        except Exception:
-            continue
+    Returns:
+        List of match results with file path, line number, matched pattern, and content.
+    """
+    root = Path(directory)
+    if not root.exists():
+        return [{"error": f"Directory not found: {directory}"}]
 
-    return results
+    needles = list(dict.fromkeys(p.encode("utf-8") for p in patterns if p))
+    if not needles:
+        return []
+
+    # The alternation only locates candidate lines; each line is then checked per needle
+    rx = re.compile(b"|".join(map(re.escape, needles)))
+    return _parallel_search(root, extensions, max_results, lambda fp: _scan_file_multi(fp, rx, needles, max_results))
@@ -10,28 +10,94 @@ Capabilities:
 - git_log: View commit history.
 """
 
+import os
 import subprocess
 import shutil
-from typing import List, Optional, Dict, Union, Any
+from typing import List, Optional, Dict, Union, Any, Final
+
+try:
+    import pygit2  # Optional: in-process reads for the hot history path
+except ImportError:
+    pygit2 = None
+
+# Resolved once: PATH is not re-walked on every call
+_GIT_BIN: Final[Optional[str]] = shutil.which("git")
+
+# Read-mostly tool: skip optional index-lock refreshes and locale-aware collation (so output
+# parsing never sees translated messages). Laid over the live environment on every call.
+_GIT_ENV_OVERRIDES: Final[Dict[str, str]] = {"GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
+
+# Shared subprocess.run options, built once at import. We handle errors manually (check=False).
+_RUN_KW: Final[Dict[str, Any]] = {"capture_output": True, "text": True, "check": False}
 
 def _run_git(args: List[str]) -> str:
     """Helper to run git commands safely."""
-    if not shutil.which("git"):
+    if _GIT_BIN is None:
         return "Error: git executable not found in PATH."
     
     try:
-        result = subprocess.run(
-            ["git"] + args,
-            capture_output=True,
-            text=True,
-            check=False  # We handle errors manually
-        )
+        # Read os.environ per call: later GIT_DIR/HOME/credential changes must reach git
+        result = subprocess.run([_GIT_BIN, *args], env={**os.environ, **_GIT_ENV_OVERRIDES}, **_RUN_KW)
         if result.returncode != 0:
             return f"Git Error ({result.returncode}): {result.stderr.strip()}"
         return result.stdout.strip()
     except Exception as e:
         return f"Execution Error: {e}"
 
+# Working directory -> opened repository; opening (discovery + odb setup) happens once
+_repos: Dict[str, Any] = {}
+
+
+def _open_repo() -> Any:
+    """Returns the cached pygit2 repository for the cwd, or None to use the git CLI."""
+    if pygit2 is None:
+        return None
+    cwd = os.getcwd()
+    repo = _repos.get(cwd)
+    if repo is None:
+        try:
+            path = pygit2.discover_repository(cwd)
+            if path is None:
+                return None
+            repo = _repos[cwd] = pygit2.Repository(path)
+        except Exception:
+            return None
+    return repo
+
+
+# Minimum abbreviated-id length for git_log. Pinned on the CLI too (--abbrev), since git's
+# default sizes %h from the repo's object count, which libgit2 cannot reproduce
+_ABBREV: Final[int] = 7
+
+
+def _short_id(repo: Any, hexsha: str, min_len: int = _ABBREV) -> str:
+    """`%h` under `--abbrev=min_len`: the shortest prefix of at least `min_len` that is unique."""
+    for length in range(min_len, len(hexsha)):
+        try:
+            repo[hexsha[:length]]
+            return hexsha[:length]
+        except ValueError:  # pygit2.AmbiguousError: another object shares this prefix
+            continue
+    return hexsha
+
+
+def _log_inprocess(repo: Any, n: int) -> Optional[str]:
+    """`git log --oneline -n` from the object database, or None if the CLI should answer."""
+    try:
+        if repo.head_is_unborn:
+            return None  # Let git report the empty-history error verbatim
+        lines: List[str] = []
+        for commit in repo.walk(repo.head.target):
+            if len(lines) >= n:
+                break
+            # %s: first paragraph of the message, folded onto one line
+            subject = " ".join(commit.message.strip().split("\n\n", 1)[0].split())
+            lines.append(f"{_short_id(repo, str(commit.id))} {subject}")
+        return "\n".join(lines)
+    except Exception:
+        return None
+
+
 def git_status() -> str:
     """
     Returns the status of the repository.
@@ -76,7 +142,12 @@ def git_log(n: int = 5) -> str:
     Args:
         n: Number of commits to show.
     """
-    return _run_git(["log", f"-n {n}", "--oneline"])
+    repo = _open_repo()
+    if repo is not None:
+        history = _log_inprocess(repo, n)
+        if history is not None:
+            return history
+    return _run_git(["log", "-n", str(n), "--no-color", f"--abbrev={_ABBREV}", "--pretty=format:%h %s"])
 
 def git_add(filename: str) -> str:
     """
@@ -6,26 +6,152 @@ Purpose: Enables the Agent to consult external LLMs (GPT-4, Claude, Llama 3)
          via the standard OpenAI Chat Completion API.
 """
 
+import asyncio
+import contextlib
+import hashlib
 import requests # type: ignore
 import json
-from typing import Optional, List, Dict, Any, Union
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Set, Union
+from requests.adapters import HTTPAdapter # type: ignore
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
 
 # Internal Imports
 try:
-    from system.config import settings
+    from system.config import get_settings
 except ImportError:
     # Fallback if running standalone
     import sys
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent.parent))
-    from system.config import settings
+    from system.config import get_settings
+
+
+# Keep-alive connections kept per host; also caps in-flight batch requests
+_POOL_MAXSIZE = 16
+# Per-request timeout, generous for slower local models
+_TIMEOUT_S = 60
+
+
+def _build_session() -> requests.Session:
+    """One pooled keep-alive session for every consultation (TCP + TLS reuse)."""
+    # Retry only what is safe for a non-idempotent POST: connection failures (nothing was
+    # sent) and gateway statuses. A read timeout means the model may still be generating,
+    # so read=False re-raises it immediately instead of sending the request again.
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=False,
+        status=2,
+        other=0,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,  # Hand the final response back to our status-code handling
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _build_session()
+
+
+# ------------------------------------------------------------------------------
+# Response Cache (exact match on endpoint + payload)
+# ------------------------------------------------------------------------------
+
+_CACHE_MAX_ENTRIES = 1024
+_CACHE_MAX_TEMPERATURE = 0.2  # Above this, replies are meant to vary: not cached by default
+_cache: "OrderedDict[str, str]" = OrderedDict()
+_cache_lock = threading.Lock()
+# Cache files whose table already exists (CREATE TABLE runs once per file, not per query)
+_schema_ready: Set[str] = set()
+
+
+def _cache_key(endpoint: str, payload: Dict[str, Any]) -> str:
+    blob = json.dumps({"endpoint": endpoint, "payload": payload}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _disk_cache() -> Optional[sqlite3.Connection]:
+    """Opens the optional on-disk cache; the schema is created once per cache file."""
+    cache_file = get_settings().OPENAI_CACHE_FILE
+    if not cache_file:
+        return None
+    conn = sqlite3.connect(cache_file, timeout=5)
+    if cache_file not in _schema_ready:
+        try:
+            conn.execute("CREATE TABLE IF NOT EXISTS replies (key TEXT PRIMARY KEY, content TEXT NOT NULL)")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        _schema_ready.add(cache_file)
+    return conn
+
+
+def _cache_get(key: str) -> Optional[str]:
+    with _cache_lock:
+        content = _cache.get(key)
+        if content is not None:
+            _cache.move_to_end(key)
+            return content
+
+    try:
+        conn = _disk_cache()
+        if conn is None:
+            return None
+        # closing(): the connection is released even when the query raises
+        with contextlib.closing(conn), conn:
+            row = conn.execute("SELECT content FROM replies WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+
+    if row is None:
+        return None
+    _cache_put(key, row[0], persist=False)
+    return str(row[0])
+
+
+def _cache_put(key: str, content: str, persist: bool = True) -> None:
+    with _cache_lock:
+        _cache[key] = content
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+    if not persist:
+        return
+    try:
+        conn = _disk_cache()
+        if conn is None:
+            return
+        with contextlib.closing(conn), conn:
+            conn.execute("INSERT OR REPLACE INTO replies (key, content) VALUES (?, ?)", (key, content))
+    except sqlite3.Error:
+        pass
 
 
 def consult_external_llm(
     query: str,
     system_instruction: str = "You are a helpful assistant.",
     model: Optional[str] = None,
-    temperature: float = 0.7
+    temperature: float = 0.7,
+    use_cache: Optional[bool] = None
 ) -> str:
     """
     Consults an external OpenAI-compatible LLM for a second opinion or specialized task.
@@ -39,10 +165,13 @@ def consult_external_llm(
         system_instruction: The persona or constraints for the external model.
         model: (Optional) Specific model identifier. Defaults to config settings.
         temperature: Creativity setting (0.0 = deterministic, 1.0 = creative).
+        use_cache: (Optional) Reuse a previous identical reply. Defaults to on only
+            for near-deterministic calls (temperature <= 0.2).
 
     Returns:
         String containing the external model's response.
     """
+    settings = get_settings()
     base_url = settings.OPENAI_BASE_URL
     api_key = settings.OPENAI_API_KEY
     target_model = model or settings.OPENAI_MODEL
@@ -77,14 +206,21 @@ def consult_external_llm(
         "max_tokens": 1024
     }
 
+    if use_cache is None:
+        use_cache = temperature <= _CACHE_MAX_TEMPERATURE
+    key = _cache_key(endpoint, payload) if use_cache else ""
+    if use_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
     try:
-        # Timeout set to 60s for slower local models
-        response = requests.post(endpoint, json=payload, headers=headers, timeout=60)
+        response = _session.post(endpoint, data=_json_dumps(payload), headers=headers, timeout=_TIMEOUT_S)
         
         if response.status_code != 200:
             return f"Error: API returned status {response.status_code}\nResponse: {response.text}"
 
-        data = response.json()
+        data = _json_loads(response.content)
         
         # Safe extraction
         choices = data.get("choices", [])
@@ -95,14 +231,69 @@ def consult_external_llm(
         
         if not content:
             return "Error: Empty content received."
-            
+
+        if use_cache:
+            _cache_put(key, str(content))
         return str(content)
 
     except requests.exceptions.Timeout:
-        return "Error: External LLM request timed out (60s)."
+        return f"Error: External LLM request timed out ({_TIMEOUT_S}s)."
     except requests.exceptions.ConnectionError:
         return f"Error: Could not connect to {base_url}. Is the server running?"
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
         return f"Error: Invalid JSON response from server.\nRaw: {response.text[:200]}"
     except Exception as e:
         return f"Error: Unexpected failure calling external LLM: {str(e)}"
+
+
+async def _consult_many(
+    queries: List[str],
+    system_instruction: str,
+    model: Optional[str],
+    temperature: float,
+    use_cache: Optional[bool]
+) -> List[str]:
+    """Runs the blocking consultations concurrently over the shared session pool."""
+    gate = asyncio.Semaphore(_POOL_MAXSIZE)
+
+    async def _one(query: str) -> str:
+        async with gate:
+            return await asyncio.to_thread(
+                consult_external_llm, query, system_instruction, model, temperature, use_cache
+            )
+
+    return list(await asyncio.gather(*(_one(q) for q in queries)))
+
+
+def consult_external_llm_many(
+    queries: List[str],
+    system_instruction: str = "You are a helpful assistant.",
+    model: Optional[str] = None,
+    temperature: float = 0.7,
+    use_cache: Optional[bool] = None
+) -> List[str]:
+    """
+    Consults an external OpenAI-compatible LLM with several independent queries at once.
+
+    Use this tool instead of repeated consult_external_llm calls when the questions do not
+    depend on each other: requests are in flight concurrently, so the wait is roughly the
+    slowest answer rather than the sum of all of them.
+
+    Args:
+        queries: The questions or task descriptions, one request each.
+        system_instruction: The persona or constraints shared by every request.
+        model: (Optional) Specific model identifier. Defaults to config settings.
+        temperature: Creativity setting (0.0 = deterministic, 1.0 = creative).
+        use_cache: (Optional) Reuse previous identical replies; see consult_external_llm.
+
+    Returns:
+        One response (or "Error: ..." string) per query, in query order.
+    """
+    batch = _consult_many(queries, system_instruction, model, temperature, use_cache)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(batch)
+    # Called from async code: asyncio.run cannot nest, so drive the batch on a helper thread
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-batch") as pool:
+        return pool.submit(asyncio.run, batch).result()
@@ -1,4 +1,57 @@
-from typing import Dict, Any, List
+import atexit
+import queue
+import sys
+import threading
+from typing import Callable, Dict, Any, List, Optional
+
+# Research progress events. Producers only enqueue; one daemon thread owns the stdout sink,
+# so concurrent swarm workers never contend on the console while researching.
+_events: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+_drainer: Optional[threading.Thread] = None
+_drainer_lock = threading.Lock()
+
+
+def _print_event(event: Dict[str, Any]) -> None:
+    # The real console, not sys.stdout: this runs whenever the drain thread gets to it,
+    # possibly while execute_python_code has sys.stdout redirected into its capture buffer
+    print(event["msg"], file=sys.__stdout__)
+
+
+# Swap for a no-op (or a collector) in tests; read per event by the drain thread
+_sink: Callable[[Dict[str, Any]], None] = _print_event
+
+
+def _drain() -> None:
+    while True:
+        event = _events.get()
+        if isinstance(event, threading.Event):  # _flush() marker
+            event.set()
+            continue
+        try:
+            _sink(event)
+        except Exception:
+            pass  # A broken sink must not kill the drain thread
+
+
+def _emit(step: int, msg: str) -> None:
+    global _drainer
+    if _drainer is None:
+        with _drainer_lock:
+            if _drainer is None:
+                _drainer = threading.Thread(target=_drain, name="research-events", daemon=True)
+                _drainer.start()
+                atexit.register(_flush)  # Don't lose the tail of the log at interpreter exit
+    _events.put({"tool": "research", "step": step, "msg": msg})
+
+
+def _flush(timeout: float = 1.0) -> bool:
+    """Blocks until every event emitted so far has reached the sink."""
+    if _drainer is None:
+        return True
+    done = threading.Event()
+    _events.put(done)
+    return done.wait(timeout)
+
 
 def perform_deep_research(topic: str, depth: int = 3) -> Dict[str, Any]:
     """
@@ -9,19 +62,19 @@ def perform_deep_research(topic: str, depth: int = 3) -> Dict[str, Any]:
         topic: The research subject.
         depth: Depth of recursion (simulated).
     """
-    print(f"🕵️ [RESEARCH] Deep dive on: {topic} (Depth: {depth})")
+    _emit(0, f"🕵️ [RESEARCH] Deep dive on: {topic} (Depth: {depth})")
     
     # Simulation of the research loop
     steps_taken = []
     
     # Step 1: Broad Search
     steps_taken.append(f"Broad search for '{topic}'")
-    print(f"   Step 1: Broad search...")
+    _emit(1, f"   Step 1: Broad search...")
     
     # Step 2: Identification of sub-topics
     sub_topics = ["Market Context", "Technical Constraints", "Historical Data"]
     steps_taken.append(f"Identified sub-topics: {sub_topics}")
-    print(f"   Step 2: Sub-topics identified: {sub_topics}")
+    _emit(2, f"   Step 2: Sub-topics identified: {sub_topics}")
     
     # Step 3: Synthesis (Mocked)
     key_insights = [
@@ -29,7 +82,7 @@ def perform_deep_research(topic: str, depth: int = 3) -> Dict[str, Any]:
         "Recent trends indicate a shift towards modular architecture.",
         "Security compliance is the primary bottleneck identified."
     ]
-    print(f"   Step 3: Synthesizing {len(key_insights)} insights...")
+    _emit(3, f"   Step 3: Synthesizing {len(key_insights)} insights...")
     
     return {
         "status": "success",
@@ -1,6 +1,138 @@
+import ast
+import builtins
 import io
 import contextlib
-from typing import Dict, Any, List
+import functools
+import types
+from types import CodeType
+from typing import Dict, Any, List, Optional, Tuple
+
+# The only modules user code may import (top-level name, so `collections.abc` counts as `collections`)
+_ALLOWED_MODULES = frozenset({
+    "math", "json", "re", "itertools", "collections", "functools", "statistics",
+    "datetime", "random", "string", "decimal", "fractions",
+})
+# Public names of allowed modules that still hand out arbitrary attributes:
+# Formatter().get_field("0.__globals__", ...) walks attributes the AST check never sees
+_HIDDEN_MODULE_ATTRS: Dict[str, frozenset] = {"string": frozenset({"Formatter"})}
+# Builtins that open files or smuggle in imports/code past the import check
+_FORBIDDEN_CALLS = frozenset({"open", "__import__", "eval", "exec", "compile"})
+# Attributes that reach interpreter internals (type hierarchy, function globals, frames)
+_FORBIDDEN_ATTRS = frozenset({
+    "__class__", "__bases__", "__base__", "__subclasses__", "__mro__", "__globals__",
+    "__code__", "__closure__", "__builtins__", "__dict__", "__getattribute__", "__func__",
+    "__self__", "__module__", "__loader__", "__spec__", "__import__", "__reduce__",
+    "__reduce_ex__", "__traceback__", "__init_subclass__", "__set_name__",
+    "gi_frame", "gi_code", "cr_frame", "cr_code", "ag_frame", "ag_code", "tb_frame",
+    "f_back", "f_globals", "f_locals", "f_builtins", "f_code",
+})
+# The only `__name__`-style identifier user code may reference
+_ALLOWED_DUNDER_NAMES = frozenset({"__name__"})
+
+
+def _find_violation(tree: ast.AST) -> Optional[str]:
+    """Returns the first forbidden construct in `tree`, or None if the code is allowed."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split(".")[0] not in _ALLOWED_MODULES:
+                    return f"import {alias.name}"
+        elif isinstance(node, ast.ImportFrom):
+            if node.level or (node.module or "").split(".")[0] not in _ALLOWED_MODULES:
+                return f"from {'.' * node.level}{node.module or ''} import"
+        elif isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Name) and node.func.id in _FORBIDDEN_CALLS:
+                return f"{node.func.id}("
+        elif isinstance(node, ast.Attribute):
+            if node.attr in _FORBIDDEN_ATTRS:
+                return node.attr
+        elif isinstance(node, ast.Name):
+            if node.id.startswith("__") and node.id not in _ALLOWED_DUNDER_NAMES:
+                return node.id  # __builtins__, __loader__, __spec__, ...
+    return None
+
+
+class _ModuleView(types.SimpleNamespace):
+    """Read-only stand-in for an allowed module, exposing only its public names."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"cannot set '{name}': sandboxed modules are read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete '{name}': sandboxed modules are read-only")
+
+
+# module name -> its view, shared by all runs (views are read-only)
+_MODULE_VIEWS: Dict[str, _ModuleView] = {}
+
+
+def _module_view(module: types.ModuleType) -> _ModuleView:
+    """
+    Returns the view of `module`: public attributes only, with re-exported modules kept
+    (as views) just when they are themselves allowed, so `json.codecs` or `random._os`
+    do not exist inside the sandbox.
+    """
+    name = module.__name__
+    view = _MODULE_VIEWS.get(name)
+    if view is not None:
+        return view
+    view = _MODULE_VIEWS[name] = _ModuleView()
+    hidden = _HIDDEN_MODULE_ATTRS.get(name, frozenset())
+    public: Dict[str, Any] = {}
+    for attr, value in vars(module).items():
+        if attr.startswith("_") or attr in hidden:
+            continue
+        if isinstance(value, types.ModuleType):
+            if value.__name__.split(".")[0] not in _ALLOWED_MODULES:
+                continue
+            value = _module_view(value)  # Registered before recursing, so cycles terminate
+        public[attr] = value
+    vars(view).update(public)
+    return view
+
+
+def _guarded_import(name: str, globals: Any = None, locals: Any = None, fromlist: Any = (), level: int = 0) -> Any:
+    """`__import__` for user code: the runtime backstop for the static import check."""
+    if level or name.split(".")[0] not in _ALLOWED_MODULES:
+        raise ImportError(f"Security Violation: import of '{name}' is forbidden.")
+    return _module_view(builtins.__import__(name, globals, locals, fromlist, level))
+
+
+# Builtins visible to user code: pure computation only. No open/eval/exec/getattr/globals,
+# and `__import__` is the guarded variant.
+_SAFE_BUILTINS: Dict[str, Any] = {
+    name: getattr(builtins, name) for name in (
+        "abs", "all", "any", "ascii", "bin", "bool", "bytearray", "bytes", "callable", "chr",
+        "classmethod", "complex", "dict", "divmod", "enumerate", "filter", "float", "format",
+        "frozenset", "hasattr", "hash", "hex", "int", "isinstance", "issubclass", "iter", "len",
+        "list", "map", "max", "min", "next", "object", "oct", "ord", "pow", "print", "property",
+        "range", "repr", "reversed", "round", "set", "slice", "sorted", "staticmethod", "str",
+        "sum", "super", "tuple", "type", "zip", "__build_class__",
+        "ArithmeticError", "AssertionError", "AttributeError", "Exception", "ImportError",
+        "IndexError", "KeyError", "LookupError", "NameError", "NotImplementedError",
+        "OverflowError", "RuntimeError", "StopIteration", "TypeError", "ValueError",
+        "ZeroDivisionError",
+    )
+}
+_SAFE_BUILTINS["__import__"] = _guarded_import
+
+
+@functools.lru_cache(maxsize=256)
+def _prepare(code: str) -> Tuple[Optional[CodeType], Optional[str]]:
+    """
+    Parses, validates and compiles `code` once; retried snippets go straight to exec.
+    Returns (code object, None) or (None, violation). Raises SyntaxError (not cached).
+    """
+    tree = ast.parse(code, "<sandbox>", "exec")
+    bad = _find_violation(tree)
+    if bad:
+        return None, bad
+    return compile(tree, "<sandbox>", "exec"), None
+
+
+# Base scope for every run; each run execs in a fresh copy so snippets can't leak state
+_SAFE_GLOBALS: Dict[str, Any] = {"__builtins__": _SAFE_BUILTINS, "__name__": "__sandbox__"}
+
 
 def execute_python_code(code: str) -> Dict[str, Any]:
     """
@@ -12,11 +144,14 @@ def execute_python_code(code: str) -> Dict[str, Any]:
     """
     print("📦 [SANDBOX] Executing code snippet...")
     
-    # Safety restrictions (Basic)
-    forbidden = ["import os", "import subprocess", "open(", "delete", "remove"]
-    for bad in forbidden:
-        if bad in code:
-            return {"status": "error", "error": f"Security Violation: '{bad}' is forbidden."}
+    # Safety restrictions: a static AST check, then execution against whitelisted builtins
+    try:
+        compiled, bad = _prepare(code)
+    except SyntaxError as e:
+        print(f"❌ [SANDBOX] Failed: {e}")
+        return {"status": "error", "error": str(e)}
+    if bad:
+        return {"status": "error", "error": f"Security Violation: '{bad}' is forbidden."}
     
     # Capture stdout
     buffer = io.StringIO()
@@ -24,8 +159,7 @@ def execute_python_code(code: str) -> Dict[str, Any]:
     try:
         with contextlib.redirect_stdout(buffer):
             # Using a limited global scope
-            safe_globals = {"__builtins__": __builtins__, "print": print, "range": range, "len": len}
-            exec(code, safe_globals)
+            exec(compiled, dict(_SAFE_GLOBALS))
             
         output = buffer.getvalue()
         print(f"   Output size: {len(output)} chars")